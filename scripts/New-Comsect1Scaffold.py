@@ -15,7 +15,11 @@ import sys
 from pathlib import Path
 
 
-INVALID_WINDOWS_CHARS = set('<>:"/\\|?*')
+INVALID_WINDOWS_CHARS = frozenset('<>:"/\\|?*')
+CONTROL_CHARS = frozenset(chr(code) for code in range(32))
+_FORBIDDEN_NAME_CHARS = INVALID_WINDOWS_CHARS | CONTROL_CHARS
+_DOTS_ONLY_RE = re.compile(r"^\.+$")
+_UNIT_NAME_RE = re.compile(r"^[a-z][a-z0-9_]*$")
 
 MCU_IAR_MAP: dict[str, dict[str, str]] = {
     "STM32F4": {"cpu": "cortex-m4", "fpu": "VFPv4_sp"},
@@ -28,6 +32,26 @@ MCU_IAR_MAP: dict[str, dict[str, str]] = {
     "STM32L0": {"cpu": "cortex-m0plus", "fpu": "none"},
 }
 
+# Legacy-mode (non-unit-qualified) headers; the content is static.
+_CFG_CORE_H = (
+    "#ifndef CFG_CORE_H\n"
+    "#define CFG_CORE_H\n"
+    "\n"
+    "/* comsect1 Core Contract header (shared types/interfaces). */\n"
+    "\n"
+    "#endif /* CFG_CORE_H */\n"
+)
+
+_CFG_PROJECT_H = (
+    "#ifndef CFG_PROJECT_H\n"
+    "#define CFG_PROJECT_H\n"
+    "\n"
+    "/* Project target interface header (customize per project).\n"
+    " * Praxis and Poiesis may include this header; Idea must not. */\n"
+    "\n"
+    "#endif /* CFG_PROJECT_H */\n"
+)
+
 
 def assert_valid_feature_name(name: str) -> None:
     trimmed = name.strip()
@@ -35,18 +59,20 @@ def assert_valid_feature_name(name: str) -> None:
         raise ValueError("Feature name cannot be empty.")
     if "/" in trimmed or "\\" in trimmed:
         raise ValueError(f"Invalid feature name: '{trimmed}' (must be a folder name, not a path)")
-    if re.match(r"^\.+$", trimmed):
+    if _DOTS_ONLY_RE.match(trimmed):
         raise ValueError(f"Invalid feature name: '{trimmed}'")
-    if any(ch in INVALID_WINDOWS_CHARS for ch in trimmed):
-        raise ValueError(f"Invalid feature name: '{trimmed}' (contains invalid path characters)")
-    if any(ord(ch) < 32 for ch in trimmed):
+    # One scan collects every forbidden character; classify only on failure.
+    forbidden = _FORBIDDEN_NAME_CHARS.intersection(trimmed)
+    if forbidden:
+        if not forbidden.isdisjoint(INVALID_WINDOWS_CHARS):
+            raise ValueError(f"Invalid feature name: '{trimmed}' (contains invalid path characters)")
         raise ValueError(f"Invalid feature name: '{trimmed}' (contains control characters)")
-    if re.match(r"^[./\\]", trimmed):
+    if trimmed.startswith("."):
         raise ValueError(f"Invalid feature name: '{trimmed}' (must be a folder name, not a path)")
 
 
 def assert_valid_unit_name(name: str) -> None:
-    if not re.match(r"^[a-z][a-z0-9_]*$", name):
+    if not _UNIT_NAME_RE.match(name):
         raise ValueError(
             f"Invalid unit name: '{name}' (must be lowercase ASCII, "
             "start with a letter, contain only [a-z0-9_])"
@@ -62,10 +88,32 @@ def to_pascal(name: str) -> str:
 
 
 def write_if_missing(path: Path, content: str) -> None:
-    if path.exists():
+    # Exclusive create: an existing file is left untouched without a separate
+    # exists() probe. Text mode keeps write_text's newline translation.
+    try:
+        fh = path.open("x", encoding="utf-8")
+    except FileExistsError:
         return
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(content, encoding="utf-8")
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            fh = path.open("x", encoding="utf-8")
+        except FileExistsError:
+            return
+    with fh:
+        fh.write(content)
+
+
+def leaf_dirs(relative_dirs: list[str]) -> list[str]:
+    """Return only the entries that are not a parent of another entry.
+
+    ``mkdir(parents=True)`` on the leaves creates every ancestor, so the
+    intermediate entries need no call of their own.
+    """
+    return [
+        rel for rel in relative_dirs
+        if not any(other.startswith(rel + "/") for other in relative_dirs)
+    ]
 
 
 def normalize_feature_args(features: list[str]) -> list[str]:
@@ -77,7 +125,8 @@ def normalize_feature_args(features: list[str]) -> list[str]:
             trimmed = item.strip()
             if trimmed:
                 names.append(trimmed)
-    return sorted(set(names))
+    # First occurrence wins; keep the order the user gave the features in.
+    return list(dict.fromkeys(names))
 
 
 def _lookup_mcu_flags(mcu: str) -> dict[str, str]:
@@ -668,13 +717,23 @@ def main() -> int:
         "deps/middleware",
     ]
 
-    for rel in relative_dirs:
+    for rel in leaf_dirs(relative_dirs):
         (root_path / rel).mkdir(parents=True, exist_ok=True)
 
     feature_names = normalize_feature_args(args.features)
+    # Validate and canonicalize every feature before creating any of them, and
+    # refuse targets that resolve outside the root (e.g. via a symlinked folder).
+    root_prefix = os.fspath(root_path) + os.sep
+    features_dir = os.path.join(os.fspath(root_path), "project", "features")
+    feature_dirs: list[str] = []
     for feature_name in feature_names:
         assert_valid_feature_name(feature_name)
-        (root_path / "project" / "features" / feature_name).mkdir(parents=True, exist_ok=True)
+        resolved = os.path.realpath(os.path.join(features_dir, feature_name))
+        if not resolved.startswith(root_prefix):
+            raise ValueError(f"Invalid feature name: '{feature_name}' (resolves outside {root_path})")
+        feature_dirs.append(resolved)
+    for feature_dir in feature_dirs:
+        os.makedirs(feature_dir, exist_ok=True)
 
     if args.full_project:
         unit = args.unit
@@ -718,37 +777,10 @@ def main() -> int:
     else:
         # Legacy mode: non-unit-qualified cfg_core.h / cfg_project.h
         cfg_core_path = root_path / "infra" / "bootstrap" / "cfg_core.h"
-        write_if_missing(
-            cfg_core_path,
-            "\n".join(
-                [
-                    "#ifndef CFG_CORE_H",
-                    "#define CFG_CORE_H",
-                    "",
-                    "/* comsect1 Core Contract header (shared types/interfaces). */",
-                    "",
-                    "#endif /* CFG_CORE_H */",
-                    "",
-                ]
-            ),
-        )
+        write_if_missing(cfg_core_path, _CFG_CORE_H)
 
         cfg_project_path = root_path / "project" / "config" / "cfg_project.h"
-        write_if_missing(
-            cfg_project_path,
-            "\n".join(
-                [
-                    "#ifndef CFG_PROJECT_H",
-                    "#define CFG_PROJECT_H",
-                    "",
-                    "/* Project target interface header (customize per project).",
-                    " * Praxis and Poiesis may include this header; Idea must not. */",
-                    "",
-                    "#endif /* CFG_PROJECT_H */",
-                    "",
-                ]
-            ),
-        )
+        write_if_missing(cfg_project_path, _CFG_PROJECT_H)
 
         print(f"comsect1 scaffold ready: {root_path}")
         print("Created: project/, infra/, deps/ (and subfolders)")
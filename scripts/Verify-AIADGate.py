@@ -4,48 +4,75 @@
 from __future__ import annotations
 
 import argparse
-import datetime as dt
-import json
-import subprocess
+import logging
+import os
 import sys
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
-from comsect1_gate_helpers import resolve_repo_root
+from comsect1_gate_helpers import iter_build_files, resolve_repo_root
 
 OOP_EXTENSIONS = {".cs", ".vb"}
+_OOP_SUFFIXES = tuple(sorted(OOP_EXTENSIONS))
+
+log = logging.getLogger("aiad.gate")
+
+
+@dataclass
+class StagePlan:
+    """A gate stage resolved up front; ``cmd`` is None when the stage is skipped.
+
+    ``inputs`` lists the directory trees the stage reads; stages with inputs are
+    eligible for the ``-UseCache`` result cache. ``build_root`` additionally
+    names a tree whose build files (see iter_build_files) the stage reads.
+    """
+
+    name: str
+    label: str
+    cmd: list[str] | None
+    note: str
+    failed_note: str = ""
+    output_path: str | None = None
+    inputs: tuple[str, ...] = ()
+    build_root: str | None = None
 
 
 def check_spec_modifications(repo_root: Path) -> list[str]:
     """Return list of spec files that have uncommitted or staged changes."""
+    import subprocess
+
     specs_dir = repo_root / "specs"
     if not specs_dir.is_dir():
         return []
-    modified: list[str] = []
     try:
-        # Staged changes
-        result = subprocess.run(
-            ["git", "diff", "--cached", "--name-only", "--", "specs/*.md"],
-            cwd=str(repo_root), capture_output=True, text=True, check=False,
-        )
-        if result.returncode == 0:
-            modified.extend(
-                line.strip() for line in result.stdout.splitlines() if line.strip()
-            )
-        # Unstaged changes
+        # One porcelain query reports staged (X) and unstaged (Y) changes together.
         result = subprocess.run(
-            ["git", "diff", "--name-only", "--", "specs/*.md"],
-            cwd=str(repo_root), capture_output=True, text=True, check=False,
+            ["git", "-C", str(repo_root), "status", "--porcelain=v1", "-z", "--untracked-files=no",
+             "--", "specs/*.md"],
+            capture_output=True, check=False,
         )
-        if result.returncode == 0:
-            modified.extend(
-                line.strip() for line in result.stdout.splitlines() if line.strip()
-            )
     except FileNotFoundError:
-        pass  # git not available
-    return sorted(set(modified))
+        return []  # git not available
+    if result.returncode != 0:
+        return []
+    modified: set[str] = set()
+    records = iter(result.stdout.split(b"\x00"))
+    for record in records:
+        if len(record) < 4:
+            continue
+        modified.add(record[3:].decode("utf-8", errors="replace"))
+        if record[:1] in (b"R", b"C"):
+            next(records, None)  # skip the rename/copy source path
+    return sorted(modified)
 
 
 def add_stage_result(
+    stages: list[dict[str, object]],
     report: dict[str, object],
     *,
     name: str,
@@ -53,60 +80,183 @@ def add_stage_result(
     exit_code: int,
     note: str,
     output_path: str | None,
-) -> None:
-    stage = {
+) -> dict[str, object]:
+    stage: dict[str, object] = {
         "name": name,
         "status": status,
         "exitCode": exit_code,
         "note": note,
         "outputPath": output_path,
     }
-    stages = report.setdefault("stages", [])
-    assert isinstance(stages, list)
     stages.append(stage)
     if status == "failed":
         report["gatePassed"] = False
+    return stage
+
 
+def write_report(report_path: Path, report: Mapping[str, object]) -> None:
+    """Atomically replace *report_path* with the current report contents."""
+    import json
 
-def run_child(cmd: list[str]) -> int:
-    result = subprocess.run(cmd, check=False)
-    return int(result.returncode)
+    tmp_path = report_path.with_name(report_path.name + ".tmp")
+    with tmp_path.open("w", encoding="utf-8") as fh:
+        json.dump(report, fh, ensure_ascii=False, indent=2, separators=(",", ": "))
+    os.replace(tmp_path, report_path)
 
 
+def run_child(cmd: list[str]) -> tuple[int, str]:
+    """Run a child verifier and return its exit code with captured console output."""
+    import subprocess
+
+    result = subprocess.run(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        env={**os.environ, "PYTHONIOENCODING": "utf-8"},
+        encoding="utf-8",
+        errors="replace",
+        check=False,
+    )
+    return int(result.returncode), result.stdout
+
+
+@contextmanager
+def argv(new: list[str]) -> Iterator[None]:
+    """Temporarily replace ``sys.argv`` for an in-process child verifier."""
+    old = sys.argv
+    sys.argv = new
+    try:
+        yield
+    finally:
+        sys.argv = old
+
+
+def run_child_in_process(cmd: list[str]) -> int:
+    """Run a sibling verifier script inside this interpreter and return its exit code.
+
+    ``cmd`` has the same shape as for ``run_child``; the interpreter path is dropped.
+    """
+    import runpy
+
+    with argv(cmd[1:]):
+        try:
+            runpy.run_path(cmd[1], run_name="__main__")
+        except SystemExit as exc:
+            if exc.code is None:
+                return 0
+            return exc.code if isinstance(exc.code, int) else 1
+    return 0
+
+
+def fingerprint_inputs(
+    roots: Iterable[str],
+    files: Iterable[str],
+    exclude: set[str],
+    cmd: list[str],
+) -> str:
+    """Return a digest of ``(path, size, mtime_ns)`` for every file a stage depends on.
+
+    Covers all files under *roots* (skipping ``.git`` and the gate's own outputs in
+    *exclude*), the individual *files* (verifier scripts, build files), and the
+    stage command line.
+    """
+    import hashlib
+
+    records: list[tuple[str, int, int]] = []
+    stack = list(roots)
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name != ".git":
+                            stack.append(entry.path)
+                    elif entry.path not in exclude and entry.is_file():
+                        st = entry.stat()
+                        records.append((entry.path, st.st_size, st.st_mtime_ns))
+        except OSError:
+            continue
+    for path in files:
+        try:
+            st = os.stat(path)
+        except OSError:
+            continue
+        records.append((path, st.st_size, st.st_mtime_ns))
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update("\0".join(cmd).encode("utf-8", "surrogateescape"))
+    for path, size, mtime_ns in sorted(records):
+        digest.update(f"\n{path}\0{size}\0{mtime_ns}".encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
+
+
+def load_stage_cache(cache_path: Path) -> dict[str, dict[str, object]]:
+    """Load the stage result cache, treating a missing or unreadable file as empty."""
+    import json
+
+    try:
+        with cache_path.open("r", encoding="utf-8") as fh:
+            data = json.load(fh)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {name: entry for name, entry in data.items() if isinstance(entry, dict)}
+
+
+@lru_cache(maxsize=32)
 def resolve_root_arg(raw: str | None, repo_root: Path) -> Path | None:
     """Resolve a user-supplied root path, making relative paths absolute against repo_root."""
     if not raw:
         return None
-    candidate = Path(raw)
-    if not candidate.is_absolute():
-        candidate = repo_root / candidate
-    return candidate.resolve()
+    if not os.path.isabs(raw):
+        raw = os.path.join(os.fspath(repo_root), raw)
+    return Path(os.path.realpath(raw))
 
 
 def has_oop_files(root: Path) -> bool:
-    """Return True if *root* contains at least one OOP source file."""
-    for ext in OOP_EXTENSIONS:
-        if next(root.rglob(f"*{ext}"), None) is not None:
-            return True
+    """Return True if *root* contains at least one OOP source file.
+
+    Walks the tree once with ``os.scandir`` and stops at the first match.
+    Results are cached per root and invalidated when the root's mtime changes.
+    """
+    root_str = os.fspath(root)
+    try:
+        mtime_ns = os.stat(root_str).st_mtime_ns
+    except OSError:
+        return False
+    return _scan_for_oop_files(root_str, mtime_ns)
+
+
+@lru_cache(maxsize=32)
+def _scan_for_oop_files(root_str: str, mtime_ns: int) -> bool:
+    stack = [root_str]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(_OOP_SUFFIXES):
+                        return True
+        except OSError:
+            continue
     return False
 
 
-def determine_stage_total(args: argparse.Namespace, code_root: Path | None,
-                          oop_root: Path | None, has_tooling_gate: bool) -> int:
-    """Calculate total number of active stages for progress display."""
-    total = 0
-    if not args.skip_spec:
-        total += 1
-    if not args.skip_tooling and has_tooling_gate:
-        total += 1
-    if not args.skip_code and code_root and code_root.is_dir():
-        total += 1
-    if not args.skip_oop and oop_root and oop_root.is_dir() and has_oop_files(oop_root):
-        total += 1
-    return max(total, 1)
+def configure_logging(level: int) -> None:
+    """Attach the gate's stdout handler once and set the verbosity level."""
+    if not log.handlers:
+        handler = logging.StreamHandler(sys.stdout)
+        handler.setFormatter(logging.Formatter("[AIAD Gate] %(message)s"))
+        log.addHandler(handler)
+        log.propagate = False
+    log.setLevel(level)
 
 
 def main() -> int:
+    import datetime as dt
+
     parser = argparse.ArgumentParser(description="Run spec/code/OOP gates and emit AIAD report.")
     parser.add_argument("-RepoRoot", dest="repo_root", default=None)
     parser.add_argument("-CodeRoot", dest="code_root", default=None)
@@ -119,8 +269,26 @@ def main() -> int:
     parser.add_argument("-SkipCode", dest="skip_code", action="store_true")
     parser.add_argument("-SkipOOP", dest="skip_oop", action="store_true",
                         help="Skip OOP architecture verification stage")
+    parser.add_argument("-NoMetaAdvisory", dest="no_meta_advisory", action="store_true",
+                        help="Skip the spec-modification advisory (no git query)")
+    parser.add_argument("-InProcess", dest="in_process", action="store_true",
+                        help="Run child verifiers sequentially inside this interpreter instead of as subprocesses")
+    parser.add_argument("-UseCache", dest="use_cache", action="store_true",
+                        help="Reuse passing code/OOP results when their input trees are unchanged")
+    verbosity = parser.add_mutually_exclusive_group()
+    verbosity.add_argument("-Verbose", "-v", dest="verbose", action="store_true",
+                           help="Also log stage commands and skip reasons")
+    verbosity.add_argument("-Quiet", "-q", dest="quiet", action="store_true",
+                           help="Only log advisories and failures (child verifier output is still shown)")
     args = parser.parse_args()
 
+    configure_logging(logging.DEBUG if args.verbose else logging.WARNING if args.quiet else logging.INFO)
+
+    # Nothing to verify and no report requested: skip git and report I/O entirely.
+    if args.skip_spec and args.skip_tooling and args.skip_code and args.skip_oop and not args.report_path:
+        log.info("All stages skipped")
+        return 0
+
     script_path = Path(__file__).resolve()
     script_dir = script_path.parent
 
@@ -152,28 +320,30 @@ def main() -> int:
     if oop_root is None and code_root and code_root.is_dir():
         oop_root = code_root
 
-    stage_total = determine_stage_total(args, code_root, oop_root, verify_tooling.is_file())
-    stage_num = 0
+    py = sys.executable
+    repo_str = str(repo_root)
 
+    stages: list[dict[str, object]] = []
     report: dict[str, object] = {
-        "generatedAtUtc": dt.datetime.now(dt.timezone.utc).isoformat().replace("+00:00", "Z"),
-        "repoRoot": str(repo_root),
-        "stages": [],
+        "generatedAtUtc": dt.datetime.now(dt.timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "repoRoot": repo_str,
+        "stages": stages,
         "gatePassed": True,
     }
 
     report_dir = report_path.parent if report_path.parent else repo_root
 
     # Stage 0: Meta-evaluation advisory (non-blocking)
-    modified_specs = check_spec_modifications(repo_root)
+    modified_specs = [] if args.no_meta_advisory else check_spec_modifications(repo_root)
     if modified_specs:
         file_list = ", ".join(modified_specs)
         advisory_note = (
             f"Spec modifications detected ({file_list}). "
             "Consider upstream alignment check (see guides/04_Meta_Evaluation/)."
         )
-        print(f"[AIAD Gate] Stage 0 (advisory): {advisory_note}")
+        log.warning("Stage 0 (advisory): %s", advisory_note)
         add_stage_result(
+            stages,
             report,
             name="meta-advisory",
             status="advisory",
@@ -181,8 +351,19 @@ def main() -> int:
             note=advisory_note,
             output_path=None,
         )
+    elif args.no_meta_advisory:
+        add_stage_result(
+            stages,
+            report,
+            name="meta-advisory",
+            status="skipped",
+            exit_code=0,
+            note="Skipped by flag",
+            output_path=None,
+        )
     else:
         add_stage_result(
+            stages,
             report,
             name="meta-advisory",
             status="clean",
@@ -191,222 +372,258 @@ def main() -> int:
             output_path=None,
         )
 
+    plans: list[StagePlan] = []
+
     # Stage 1: Spec verification
     if not args.skip_spec:
-        stage_num += 1
-        print(f"[AIAD Gate] Stage {stage_num}/{stage_total}: Verify-Spec")
-        spec_cmd = [sys.executable, str(verify_spec), "-RepoRoot", str(repo_root)]
-        spec_exit = run_child(spec_cmd)
-        if spec_exit == 0:
-            add_stage_result(
-                report,
-                name="spec",
-                status="passed",
-                exit_code=spec_exit,
-                note="Verify-Spec passed",
-                output_path=None,
-            )
-        else:
-            add_stage_result(
-                report,
-                name="spec",
-                status="failed",
-                exit_code=spec_exit,
-                note="Verify-Spec reported issues",
-                output_path=None,
-            )
-    else:
-        add_stage_result(
-            report,
+        plans.append(StagePlan(
             name="spec",
-            status="skipped",
-            exit_code=0,
-            note="Skipped by flag",
-            output_path=None,
-        )
+            label="Verify-Spec",
+            cmd=[py, str(verify_spec), "-RepoRoot", repo_str],
+            note="Verify-Spec passed",
+            failed_note="Verify-Spec reported issues",
+        ))
+    else:
+        plans.append(StagePlan(name="spec", label="Verify-Spec", cmd=None, note="Skipped by flag"))
 
     # Stage 2: AI tooling consistency verification
-    if not args.skip_tooling:
-        if not verify_tooling.is_file():
-            add_stage_result(
-                report,
-                name="tooling",
-                status="skipped",
-                exit_code=0,
-                note="Verify-ToolingConsistency.py not found; skipped tooling stage",
-                output_path=None,
-            )
-        else:
-            stage_num += 1
-            print(f"[AIAD Gate] Stage {stage_num}/{stage_total}: Verify-ToolingConsistency")
-            tooling_cmd = [sys.executable, str(verify_tooling), "-RepoRoot", str(repo_root)]
-            tooling_exit = run_child(tooling_cmd)
-            if tooling_exit == 0:
-                add_stage_result(
-                    report,
-                    name="tooling",
-                    status="passed",
-                    exit_code=tooling_exit,
-                    note="Verify-ToolingConsistency passed",
-                    output_path=None,
-                )
-            else:
-                add_stage_result(
-                    report,
-                    name="tooling",
-                    status="failed",
-                    exit_code=tooling_exit,
-                    note="Verify-ToolingConsistency reported issues",
-                    output_path=None,
-                )
+    if args.skip_tooling:
+        plans.append(StagePlan(name="tooling", label="Verify-ToolingConsistency", cmd=None, note="Skipped by flag"))
+    elif not verify_tooling.is_file():
+        plans.append(StagePlan(
+            name="tooling",
+            label="Verify-ToolingConsistency",
+            cmd=None,
+            note="Verify-ToolingConsistency.py not found; skipped tooling stage",
+        ))
     else:
-        add_stage_result(
-            report,
+        plans.append(StagePlan(
             name="tooling",
-            status="skipped",
-            exit_code=0,
-            note="Skipped by flag",
-            output_path=None,
-        )
+            label="Verify-ToolingConsistency",
+            cmd=[py, str(verify_tooling), "-RepoRoot", repo_str],
+            note="Verify-ToolingConsistency passed",
+            failed_note="Verify-ToolingConsistency reported issues",
+        ))
 
     # Stage 3: C/embedded code architecture verification
-    if not args.skip_code:
-        if not code_root or not code_root.is_dir():
-            add_stage_result(
-                report,
-                name="code",
-                status="skipped",
-                exit_code=0,
-                note="Code root not provided/found; skipped code architecture stage",
-                output_path=None,
-            )
-        else:
-            stage_num += 1
-            code_json = report_dir / "aiad-code-verify.json"
-            print(f"[AIAD Gate] Stage {stage_num}/{stage_total}: Verify-Comsect1Code")
-            code_cmd = [
-                sys.executable,
+    if args.skip_code:
+        plans.append(StagePlan(name="code", label="Verify-Comsect1Code", cmd=None, note="Skipped by flag"))
+    elif not code_root or not code_root.is_dir():
+        plans.append(StagePlan(
+            name="code",
+            label="Verify-Comsect1Code",
+            cmd=None,
+            note="Code root not provided/found; skipped code architecture stage",
+        ))
+    else:
+        code_json = str(report_dir / "aiad-code-verify.json")
+        plans.append(StagePlan(
+            name="code",
+            label="Verify-Comsect1Code",
+            cmd=[
+                py,
                 str(verify_code),
                 "-Root",
                 str(code_root),
                 "-RepoRoot",
-                str(repo_root),
+                repo_str,
                 "-JsonOut",
-                str(code_json),
-            ]
-            code_exit = run_child(code_cmd)
-            if code_exit == 0:
-                add_stage_result(
-                    report,
-                    name="code",
-                    status="passed",
-                    exit_code=code_exit,
-                    note="Verify-Comsect1Code passed",
-                    output_path=str(code_json),
-                )
-            else:
-                add_stage_result(
-                    report,
-                    name="code",
-                    status="failed",
-                    exit_code=code_exit,
-                    note="Verify-Comsect1Code reported errors",
-                    output_path=str(code_json),
-                )
-    else:
-        add_stage_result(
-            report,
-            name="code",
-            status="skipped",
-            exit_code=0,
-            note="Skipped by flag",
-            output_path=None,
-        )
+                code_json,
+            ],
+            note="Verify-Comsect1Code passed",
+            failed_note="Verify-Comsect1Code reported errors",
+            output_path=code_json,
+            inputs=(str(code_root),),
+            # Build evidence comes from build files across the repo root, so
+            # only those (not specs, guides or build output) join CodeRoot.
+            build_root=repo_str,
+        ))
 
     # Stage 4: OOP architecture verification
-    if not args.skip_oop:
-        if not verify_oop.is_file():
+    if args.skip_oop:
+        plans.append(StagePlan(name="oop", label="Verify-OOPCode", cmd=None, note="Skipped by flag"))
+    elif not verify_oop.is_file():
+        plans.append(StagePlan(
+            name="oop",
+            label="Verify-OOPCode",
+            cmd=None,
+            note="Verify-OOPCode.py not found; skipped OOP stage",
+        ))
+    elif not oop_root or not oop_root.is_dir():
+        plans.append(StagePlan(
+            name="oop",
+            label="Verify-OOPCode",
+            cmd=None,
+            note="OOP root not provided/found; skipped OOP stage",
+        ))
+    elif not has_oop_files(oop_root):
+        plans.append(StagePlan(
+            name="oop",
+            label="Verify-OOPCode",
+            cmd=None,
+            note=f"No OOP source files ({', '.join(sorted(OOP_EXTENSIONS))}) found under {oop_root}",
+        ))
+    else:
+        oop_json = str(report_dir / "aiad-oop-verify.json")
+        plans.append(StagePlan(
+            name="oop",
+            label="Verify-OOPCode",
+            cmd=[
+                py,
+                str(verify_oop),
+                "-Root",
+                str(oop_root),
+                "-ReportPath",
+                oop_json,
+            ],
+            note="Verify-OOPCode passed",
+            failed_note="Verify-OOPCode reported errors",
+            output_path=oop_json,
+            inputs=(str(oop_root),),
+        ))
+
+    # With -UseCache, a stage whose inputs, verifier scripts and command line are
+    # unchanged since its last passing run reuses that result.
+    cache_path = repo_root / ".aiad-gate-cache.json"
+    stage_cache = load_stage_cache(cache_path) if args.use_cache else {}
+    fingerprints: dict[str, str] = {}
+    cached: set[str] = set()
+    if args.use_cache:
+        gate_outputs = {
+            str(report_path),
+            str(report_path.with_name(report_path.name + ".tmp")),
+            str(cache_path),
+            str(cache_path.with_name(cache_path.name + ".tmp")),
+        }
+        gate_outputs.update(plan.output_path for plan in plans if plan.output_path)
+        verifier_scripts = sorted(str(path) for path in script_dir.glob("*.py"))
+        for plan in plans:
+            if plan.cmd is None or not plan.inputs:
+                continue
+            files = verifier_scripts
+            if plan.build_root is not None:
+                files = files + [str(path) for path in iter_build_files(Path(plan.build_root))]
+            fingerprint = fingerprint_inputs(plan.inputs, files, gate_outputs, plan.cmd)
+            fingerprints[plan.name] = fingerprint
+            entry = stage_cache.get(plan.name, {})
+            if (
+                entry.get("hash") == fingerprint
+                and entry.get("exitCode") == 0
+                and (plan.output_path is None or os.path.isfile(plan.output_path))
+            ):
+                cached.add(plan.name)
+
+    # Register every stage in plan order up front. Runnable stages start out
+    # "pending" and are filled in as they finish; the report is rewritten after
+    # each one so partial results survive an interrupted run.
+    pending: dict[str, dict[str, object]] = {}
+    for plan in plans:
+        if plan.cmd is None:
+            log.debug("Stage %s skipped: %s", plan.name, plan.note)
             add_stage_result(
+                stages,
                 report,
-                name="oop",
+                name=plan.name,
                 status="skipped",
                 exit_code=0,
-                note="Verify-OOPCode.py not found; skipped OOP stage",
+                note=plan.note,
                 output_path=None,
             )
-        elif not oop_root or not oop_root.is_dir():
+        elif plan.name in cached:
+            log.info("%s: inputs unchanged, reusing cached result", plan.label)
             add_stage_result(
+                stages,
                 report,
-                name="oop",
-                status="skipped",
+                name=plan.name,
+                status="cached",
                 exit_code=0,
-                note="OOP root not provided/found; skipped OOP stage",
-                output_path=None,
+                note=f"{plan.note} (cached)",
+                output_path=plan.output_path,
             )
-        elif not has_oop_files(oop_root):
-            add_stage_result(
+        else:
+            pending[plan.name] = add_stage_result(
+                stages,
                 report,
-                name="oop",
-                status="skipped",
+                name=plan.name,
+                status="pending",
                 exit_code=0,
-                note=f"No OOP source files ({', '.join(sorted(OOP_EXTENSIONS))}) found under {oop_root}",
+                note="Not finished",
                 output_path=None,
             )
-        else:
-            stage_num += 1
-            oop_json = report_dir / "aiad-oop-verify.json"
-            print(f"[AIAD Gate] Stage {stage_num}/{stage_total}: Verify-OOPCode")
-            oop_cmd = [
-                sys.executable,
-                str(verify_oop),
-                "-Root",
-                str(oop_root),
-                "-ReportPath",
-                str(oop_json),
-            ]
-            oop_exit = run_child(oop_cmd)
-            if oop_exit == 0:
-                add_stage_result(
-                    report,
-                    name="oop",
-                    status="passed",
-                    exit_code=oop_exit,
-                    note="Verify-OOPCode passed",
-                    output_path=str(oop_json),
-                )
-            else:
-                add_stage_result(
-                    report,
-                    name="oop",
-                    status="failed",
-                    exit_code=oop_exit,
-                    note="Verify-OOPCode reported errors",
-                    output_path=str(oop_json),
-                )
-    else:
-        add_stage_result(
-            report,
-            name="oop",
-            status="skipped",
-            exit_code=0,
-            note="Skipped by flag",
-            output_path=None,
-        )
 
-    report_path.parent.mkdir(parents=True, exist_ok=True)
-    report_path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
+    # An interrupted run must not leave a passing report behind, so the gate
+    # only reads as passed once no stage is pending or failed.
+    report["gatePassed"] = report["gatePassed"] and not pending
 
-    print(f"[AIAD Gate] Report: {report_path}")
+    # The report directory usually exists already; stat it before paying for mkdir.
+    try:
+        report_path.parent.stat()
+    except FileNotFoundError:
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+    write_report(report_path, report)
+
+    def finish_stage(plan: StagePlan, exit_code: int) -> None:
+        stage = pending[plan.name]
+        stage["status"] = "passed" if exit_code == 0 else "failed"
+        stage["exitCode"] = exit_code
+        stage["note"] = plan.note if exit_code == 0 else plan.failed_note
+        stage["outputPath"] = plan.output_path
+        report["gatePassed"] = all(s["status"] not in ("pending", "failed") for s in stages)
+        write_report(report_path, report)
+        if plan.name in fingerprints:
+            if exit_code == 0:
+                stage_cache[plan.name] = {"hash": fingerprints[plan.name], "exitCode": 0, "note": plan.note}
+            else:
+                stage_cache.pop(plan.name, None)
+
+    # The child verifiers read disjoint inputs, so run them concurrently and
+    # print each stage's captured output as a block once it finishes.
+    runnable = [plan for plan in plans if plan.cmd is not None and plan.name not in cached]
+    stage_total = max(len(runnable), 1)
+    stage_nums = {plan.name: num for num, plan in enumerate(runnable, start=1)}
+    print_lock = threading.Lock()
+
+    def run_stage(plan: StagePlan) -> int:
+        assert plan.cmd is not None
+        log.debug("Running: %s", plan.cmd)
+        exit_code, output = run_child(plan.cmd)
+        with print_lock:
+            log.info("Stage %d/%d: %s", stage_nums[plan.name], stage_total, plan.label)
+            sys.stdout.write(output)
+            sys.stdout.flush()
+        return exit_code
+
+    if args.in_process:
+        # sys.argv is process-global, so in-process stages run one at a time.
+        for plan in runnable:
+            assert plan.cmd is not None
+            log.info("Stage %d/%d: %s", stage_nums[plan.name], stage_total, plan.label)
+            log.debug("Running in-process: %s", plan.cmd)
+            exit_code = run_child_in_process(plan.cmd)
+            sys.stdout.flush()
+            finish_stage(plan, exit_code)
+    elif runnable:
+        with ThreadPoolExecutor(max_workers=len(runnable)) as executor:
+            futures = {executor.submit(run_stage, plan): plan for plan in runnable}
+            # Results are consumed on this thread only, so report writes never overlap.
+            for future in as_completed(futures):
+                finish_stage(futures[future], future.result())
+
+    if args.use_cache:
+        write_report(cache_path, stage_cache)
+
+    log.info("Report: %s", report_path)
     gate_passed = report.get("gatePassed")
-    print(f"[AIAD Gate] Status: {'PASSED' if gate_passed else 'FAILED'}")
 
     if gate_passed:
-        print("[AIAD Gate] Gate passed -- no action required.")
+        log.info("Status: PASSED")
+        log.info("Gate passed -- no action required.")
     else:
         failed_stages = [
-            s["name"] for s in report.get("stages", []) if s.get("status") == "failed"
+            s["name"] for s in stages if s["status"] == "failed"
         ]
-        print(f"[AIAD Gate] Gate FAILED -- stage(s) [{', '.join(failed_stages)}] must be resolved.")
+        log.error("Status: FAILED")
+        log.error("Gate FAILED -- stage(s) [%s] must be resolved.", ", ".join(failed_stages))
 
     return 0 if gate_passed else 2
 
@@ -5,17 +5,29 @@ from __future__ import annotations
 
 import argparse
 import datetime as dt
+import hashlib
 import json
 import os
 import re
 import sys
-from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import Callable, Iterator
 
 from comsect1_gate_helpers import (
+    FindingTable,
     add_finding,
     collect_source_files,
     count_code_lines as _count_code_lines,
+    count_code_lines_from_text as _count_code_lines_from_text,
+    count_domain_conditionals,
+    count_file_domain_conditionals,
+    count_poi_wrappers,
+    iter_build_files,
+    praxis_red_flag_facts,
+    read_source_text,
     validate_comsect1_root_boundary,
     verify_folder_structure,
     verify_layer_balance,
@@ -25,13 +37,26 @@ from comsect1_gate_helpers import (
 
 SOURCE_EXTENSIONS = {".c", ".h", ".cpp", ".hpp"}
 INCLUDE_REGEX = re.compile(r'^\s*#\s*include\s*[<"](?P<path>[^">]+)[">]')
+# Whole-text variant of INCLUDE_REGEX: "\s" narrowed to whitespace that cannot end
+# a line, and leading BOMs skipped like the per-line lstrip("\ufeff").
+_INLINE_WS = r"[^\S\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]"
+INCLUDE_MULTILINE_REGEX = re.compile(
+    rf'^\ufeff*{_INLINE_WS}*#{_INLINE_WS}*include{_INLINE_WS}*[<"](?P<path>[^">\n]+)[">]',
+    re.MULTILINE,
+)
+# Line breaks str.splitlines() honours besides "\n"/"\r"; their presence forces
+# the per-line path so include line numbers stay identical.
+_EXTRA_LINE_BREAK_RE = re.compile(r"[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
 SYSTEM_INCLUDE_REGEX = re.compile(r"^\s*#\s*include\s*<")
 PLATFORM_PATH_SEGMENT_RE = re.compile(r"(^|[\\/])(?:cmsis|vendor|device|board|boards?|bsp|port|ports)([\\/]|$)", re.IGNORECASE)
 PLATFORM_PORT_SEGMENT_RE = re.compile(r"(^|[\\/])ports?([\\/]|$)", re.IGNORECASE)
 BOARD_INCLUDE_LEAF_RE = re.compile(r"^(?:bsp_|board_)", re.IGNORECASE)
 LEGACY_PLATFORM_BUILD_PATH_RE = re.compile(r"(^|[\\/])(?:platform|ports?)([\\/]|$)", re.IGNORECASE)
-BUILD_FILE_PATTERNS = ("CMakeLists.txt", "*.cmake", "Makefile", "makefile", "*.mk")
-BUILD_SKIP_DIRS = {".git", ".hg", ".svn", ".cmakebuild", "build", "out", "dist", "node_modules", ".venv", "venv", "__pycache__"}
+LEGACY_PLATFORM_BUILD_ARG_RE = re.compile(r"(^|[\s\"'(<:=])(?:platform|ports?)/", re.IGNORECASE)
+LEGACY_PLATFORM_BUILD_SEGMENT_RE = re.compile(r"/(?:platform|ports?)(/|$)", re.IGNORECASE)
+BOARD_PATH_SEGMENT_RE = re.compile(r"(^|/)(?:board|boards?|bsp|port|ports)(/|$)")
+FEATURE_PATH_RE = re.compile(r"[\\/]project[\\/]features[\\/](?P<feature>[^\\/]+)")
+DEPS_PATH_SEGMENT_RE = re.compile(r"(^|[\\/])deps([\\/]|$)")
 BUILD_EVIDENCE_RULES: tuple[tuple[str, re.Pattern[str], str], ...] = (
     (
         "macro-branch",
@@ -75,6 +100,12 @@ PLATFORM_SYMBOL_RULES: tuple[tuple[str, re.Pattern[str], str], ...] = (
 
 # C-specific code line counter: skip preprocessor directives
 count_code_lines = partial(_count_code_lines, line_comment_prefixes=("//",), skip_preprocessor=True)
+count_code_lines_from_text = partial(_count_code_lines_from_text, line_comment_prefixes=("//",), skip_preprocessor=True)
+
+# Per-file scan cache (-UseCache), stored at the repo root.
+SCAN_CACHE_NAME = ".comsect1-verify-cache.json"
+# Below this many files to read, worker start-up costs more than it saves.
+PARALLEL_SCAN_MIN_FILES = 64
 
 # Function-level naming checks for service layer
 SVC_EXPORT_FUNC_RE = re.compile(r"^(?!static\b)\w[\w\s\*]*?\b(\w+)\s*\(")
@@ -82,62 +113,77 @@ SVC_HEADER_FUNC_DECL_RE = re.compile(r"^(?!static\b)\w[\w\s\*]*?\b(\w+)\s*\(.*\)
 
 
 def full_path(path_like: str | Path) -> str:
-    return os.path.abspath(os.fspath(path_like))
-
-
-def get_role_info(file_name: str, unit_name: str | None = None) -> tuple[str, str | None]:
-    stem = Path(file_name).stem
-
-    if re.match(r"^inf_", stem):
-        return "invalid_prefix", None
-
-    core_cfg_names = {"cfg_core"}
-    core_map: dict[str, str] = {
-        "ida_core": "core_idea",
-        "poi_core": "core_poiesis",
-        "prx_core": "core_praxis",
+    return _abspath(os.fspath(path_like))
+
+
+# Path helpers below are memoized on plain strings: every file is classified
+# several times per run. main() clears these caches at start-up.
+@lru_cache(maxsize=None)
+def _abspath(path: str) -> str:
+    return os.path.abspath(path)
+
+
+_FEATURE_ROLE_PREFIXES: dict[str, str] = {
+    "ida_": "idea",
+    "prx_": "praxis",
+    "poi_": "poiesis",
+    "cfg_": "feature_cfg",
+    "db_": "feature_db",
+}
+_MODULE_ROLE_PREFIXES: dict[str, str] = {
+    "svc_": "service",
+    "mdw_": "middleware",
+    "hal_": "hal",
+    "bsp_": "bsp",
+    "stm_": "datastream",
+    "app_": "app",
+}
+
+
+def path_stem(file_name: str) -> str:
+    """Return ``Path(file_name).stem`` for a bare file name without building a Path."""
+    dot = file_name.rfind(".")
+    return file_name[:dot] if 0 < dot < len(file_name) - 1 else file_name
+
+
+@lru_cache(maxsize=None)
+def _core_roles(unit_name: str | None) -> dict[str, tuple[str, str | None]]:
+    roles: dict[str, tuple[str, str | None]] = {
+        "cfg_core": ("core_cfg", "core"),
+        "ida_core": ("core_idea", "core"),
+        "poi_core": ("core_poiesis", "core"),
+        "prx_core": ("core_praxis", "core"),
     }
-
     if unit_name:
-        core_cfg_names.add(f"cfg_core_{unit_name}")
-        core_map.update(
+        roles.update(
             {
-                f"ida_core_{unit_name}": "core_idea",
-                f"poi_core_{unit_name}": "core_poiesis",
-                f"prx_core_{unit_name}": "core_praxis",
+                f"cfg_core_{unit_name}": ("core_cfg", "core"),
+                f"ida_core_{unit_name}": ("core_idea", "core"),
+                f"poi_core_{unit_name}": ("core_poiesis", "core"),
+                f"prx_core_{unit_name}": ("core_praxis", "core"),
             }
         )
+    return roles
 
-    if stem in core_cfg_names:
-        return "core_cfg", "core"
-    if stem in core_map:
-        return core_map[stem], "core"
-
-    m = re.match(r"^(?P<p>ida|prx|poi|cfg|db)_(?P<f>.+)$", stem)
-    if m:
-        role_map = {
-            "ida": "idea",
-            "prx": "praxis",
-            "poi": "poiesis",
-            "cfg": "feature_cfg",
-            "db": "feature_db",
-        }
-        return role_map[m.group("p")], m.group("f")
 
-    if re.match(r"^svc_", stem):
-        return "service", None
-    if re.match(r"^mdw_", stem):
-        return "middleware", None
-    if re.match(r"^hal_", stem):
-        return "hal", None
-    if re.match(r"^bsp_", stem):
-        return "bsp", None
-    if re.match(r"^stm_", stem):
-        return "datastream", None
-    if re.match(r"^app_", stem):
-        return "app", None
+@lru_cache(maxsize=None)
+def get_role_info(file_name: str, unit_name: str | None = None) -> tuple[str, str | None]:
+    stem = path_stem(file_name)
 
-    return "unknown", None
+    if stem.startswith("inf_"):
+        return "invalid_prefix", None
+
+    core_role = _core_roles(unit_name).get(stem)
+    if core_role is not None:
+        return core_role
+
+    # Every role prefix is "<3 chars>_" except "db_".
+    prefix = "db_" if stem.startswith("db_") else stem[:4]
+    feature_role = _FEATURE_ROLE_PREFIXES.get(prefix)
+    if feature_role is not None and len(stem) > len(prefix):
+        return feature_role, stem[len(prefix):]
+
+    return _MODULE_ROLE_PREFIXES.get(prefix, "unknown"), None
 
 
 def get_includes(path: Path) -> list[dict[str, object]]:
@@ -146,6 +192,34 @@ def get_includes(path: Path) -> list[dict[str, object]]:
 
 
 def get_includes_from_text(text: str) -> list[dict[str, object]]:
+    if "#" not in text:
+        return []
+    if _EXTRA_LINE_BREAK_RE.search(text):
+        return _get_includes_per_line(text)
+
+    # One regex pass over the whole text; line numbers are accumulated
+    # incrementally between matches instead of splitting every line.
+    includes: list[dict[str, object]] = []
+    line_no = 1
+    last_pos = 0
+    for m in INCLUDE_MULTILINE_REGEX.finditer(text):
+        start = m.start()
+        line_no += text.count("\n", last_pos, start)
+        last_pos = start
+        line_end = text.find("\n", start)
+        include_path = m.group("path")
+        includes.append(
+            {
+                "Line": line_no,
+                "IncludePath": include_path,
+                "Leaf": os.path.basename(include_path),
+                "Raw": text[start:line_end if line_end >= 0 else len(text)].lstrip("\ufeff"),
+            }
+        )
+    return includes
+
+
+def _get_includes_per_line(text: str) -> list[dict[str, object]]:
     includes: list[dict[str, object]] = []
     for idx, line in enumerate(text.splitlines(), start=1):
         line = line.lstrip("\ufeff")
@@ -164,30 +238,137 @@ def get_includes_from_text(text: str) -> list[dict[str, object]]:
     return includes
 
 
-def test_is_under_path(path_like: str | Path, base_path: str | Path) -> bool:
-    full = full_path(path_like)
-    base = full_path(base_path)
-    if not base.endswith(os.sep):
-        base += os.sep
-    return full.lower().startswith(base.lower())
+# Zone tag -> folder segments below the code root (Section 7.3).
+PATH_ZONES: dict[str, tuple[str, ...]] = {
+    "api": ("api",),
+    "bootstrap": ("infra", "bootstrap"),
+    "service": ("infra", "service"),
+    "hal": ("infra", "platform", "hal"),
+    "bsp": ("infra", "platform", "bsp"),
+    "deps": ("deps",),
+    "deps_extern": ("deps", "extern"),
+    "deps_middleware": ("deps", "middleware"),
+    "project_features": ("project", "features"),
+    "project_config": ("project", "config"),
+    "project_datastreams": ("project", "datastreams"),
+}
+
+# Zones that a nested deps unit (deps/extern/<unit>/..., deps/middleware/<unit>/...)
+# may carry as its own segments anywhere in the path.
+NESTED_UNIT_ZONES = frozenset(
+    {"bootstrap", "service", "hal", "bsp", "project_features", "project_config", "project_datastreams"}
+)
+
+
+def build_zone_trie(zones: dict[str, tuple[str, ...]]) -> dict[str, dict]:
+    """Build a nested dict trie of lowercased folder segments; the "" key holds a zone tag."""
+    trie: dict[str, dict] = {}
+    for tag, segments in zones.items():
+        node = trie
+        for segment in segments:
+            node = node.setdefault(segment.lower(), {})
+        node[""] = tag
+    return trie
+
+
+PATH_ZONE_TRIE = build_zone_trie(PATH_ZONES)
 
 
-def test_contains_subpath(path_like: str | Path, subpath: str) -> bool:
-    normalized_path = full_path(path_like).replace("/", "\\")
-    needle = subpath.replace("/", "\\")
-    return needle.lower() in normalized_path.lower()
+def walk_zone_trie(parts: list[str], start: int = 0) -> Iterator[str]:
+    """Yield zone tags whose segments match *parts* from *start* and still have a child entry.
+
+    Segments are compared case-insensitively; only the few segments the walk
+    actually reaches are lowercased.
+    """
+    node = PATH_ZONE_TRIE
+    for index in range(start, len(parts) - 1):
+        node = node.get(parts[index].lower())
+        if node is None:
+            return
+        tag = node.get("")
+        if tag:
+            yield tag
+
+
+@lru_cache(maxsize=None)
+def _path_zones(path: str, root: str) -> tuple[frozenset[str], frozenset[str]]:
+    # Source files are collected from *root*, so its prefix matches exactly;
+    # only the segments below it need classifying.
+    root_prefix = root.rstrip(os.sep) + os.sep
+    if not path.startswith(root_prefix):
+        return frozenset(), frozenset()
+
+    under = frozenset(walk_zone_trie(path[len(root_prefix):].split(os.sep)))
+    if not under & {"deps_extern", "deps_middleware"}:
+        return under, frozenset()
+    parts = path.split(os.sep)
+    nested = frozenset(
+        tag
+        for start in range(1, len(parts))
+        for tag in walk_zone_trie(parts, start)
+        if tag in NESTED_UNIT_ZONES
+    )
+    return under, nested
+
+
+def get_path_zones(path_like: str | Path, root_path: Path) -> tuple[frozenset[str], frozenset[str]]:
+    """Classify *path_like* against PATH_ZONES below *root_path*.
+
+    Returns ``(under, nested)``: the zones the file sits directly under, and for
+    files inside a nested deps unit, the zone segments found anywhere in its path.
+    """
+    return _path_zones(full_path(path_like), os.fspath(root_path))
+
+
+@dataclass(frozen=True)
+class FileMeta:
+    """Path-derived facts about one source file, computed once per run."""
+
+    path: Path
+    role: str
+    feature: str | None
+    path_feature: str | None
+    under_zones: frozenset[str]
+    nested_zones: frozenset[str]
+
+    @property
+    def any_zones(self) -> frozenset[str]:
+        return self.under_zones | self.nested_zones
+
+    @property
+    def is_header(self) -> bool:
+        return self.path.suffix.lower() in {".h", ".hpp"}
+
+
+def build_file_meta(path: Path, root_path: Path, unit_name: str | None) -> FileMeta:
+    role, feature = get_role_info(path.name, unit_name)
+    path_feature = get_feature_from_path(path)
+    under_zones, nested_zones = get_path_zones(path, root_path)
+    return FileMeta(
+        path=path,
+        role=role,
+        feature=path_feature or feature,
+        path_feature=path_feature,
+        under_zones=under_zones,
+        nested_zones=nested_zones,
+    )
 
 
 def get_feature_from_path(path_like: str | Path) -> str | None:
-    normalized = full_path(path_like).replace("/", "\\")
-    m = re.search(r"[\\/]project[\\/]features[\\/](?P<feature>[^\\/]+)", normalized)
+    return _feature_from_full_path(full_path(path_like))
+
+
+@lru_cache(maxsize=None)
+def _feature_from_full_path(path: str) -> str | None:
+    normalized = path.replace("/", "\\")
+    m = FEATURE_PATH_RE.search(normalized)
     return m.group("feature") if m else None
 
 
 def test_is_same_feature_header(leaf: str, prefix: str, feature: str | None) -> bool:
     if not feature:
         return False
-    stem = Path(leaf).stem.lower()
+    stem = path_stem(leaf).lower()
     base = f"{prefix}_{feature}".lower()
     return stem == base or stem.startswith(base + "_")
 
@@ -205,6 +386,194 @@ def test_is_same_feature_include(
     return test_is_same_feature_header(leaf=leaf, prefix=prefix, feature=feature)
 
 
+@dataclass(frozen=True)
+class IncludeContext:
+    """Per-file inputs shared by the include validators."""
+
+    feature: str | None
+    is_under_api: bool
+    core_config_names: set[str]
+    project_config_names: set[str]
+    ida_core_names: set[str]
+    prx_core_names: set[str]
+    poi_core_names: set[str]
+    header_feature_owners: dict[str, set[str]]
+    project_resource_header_names: set[str]
+
+    def same_feature(self, leaf: str, prefix: str) -> bool:
+        return test_is_same_feature_include(leaf, prefix, self.feature, self.header_feature_owners)
+
+
+# A validator yields (rule, message) error pairs for one non-system include,
+# given its leaf, include_leaf_prefix(leaf), the include path and the context.
+IncludeValidator = Callable[[str, str, str, IncludeContext], Iterator[tuple[str, str]]]
+
+_LOWER_LAYER_PREFIXES = frozenset({"db_", "stm_", "mdw_", "svc_", "hal_", "bsp_"})
+_UPPER_LAYER_PREFIXES = frozenset({"ida_", "prx_", "poi_"})
+_PLATFORM_FORBIDDEN_PREFIXES = frozenset({"ida_", "prx_", "poi_", "mdw_", "svc_"})
+# Every role prefix an include rule tests for.
+INCLUDE_LEAF_PREFIXES = _LOWER_LAYER_PREFIXES | _UPPER_LAYER_PREFIXES | {"cfg_"}
+
+
+@lru_cache(maxsize=None)
+def include_leaf_prefix(leaf: str) -> str:
+    """Return the role prefix ("prx_", "db_", ...) of an include leaf, or "".
+
+    All rule prefixes are "<word>_", so one partition plus a set lookup
+    replaces testing the leaf against each prefix in turn.
+    """
+    head, sep, _ = leaf.partition("_")
+    prefix = head + sep
+    return prefix if prefix in INCLUDE_LEAF_PREFIXES else ""
+
+
+def check_deps_path_include(leaf: str, leaf_prefix: str, include_path: str, ctx: IncludeContext) -> Iterator[tuple[str, str]]:
+    if DEPS_PATH_SEGMENT_RE.search(include_path):
+        yield "include.deps_path", f"Do not include dependency repository paths directly from core/project layers: {include_path}"
+
+
+def check_core_idea_include(leaf: str, leaf_prefix: str, include_path: str, ctx: IncludeContext) -> Iterator[tuple[str, str]]:
+    if leaf_prefix == "prx_" and leaf not in ctx.prx_core_names:
+        yield "ida_core.include", f"ida_core must not include feature praxis: {include_path}"
+    if leaf_prefix == "poi_" and leaf not in ctx.poi_core_names:
+        yield "ida_core.include", f"ida_core must not include feature poiesis: {include_path}"
+    if leaf_prefix == "cfg_" and leaf not in ctx.core_config_names:
+        yield "ida_core.include", f"ida_core may include only core contract headers: {include_path}"
+    if leaf_prefix in _LOWER_LAYER_PREFIXES:
+        yield "ida_core.include", f"ida_core must not include lower layer/resource headers directly: {include_path}"
+
+
+def check_idea_include(leaf: str, leaf_prefix: str, include_path: str, ctx: IncludeContext) -> Iterator[tuple[str, str]]:
+    if leaf_prefix == "prx_" and not ctx.same_feature(leaf, "prx"):
+        yield "ida.include", f"Idea must include only its own feature Praxis headers: {include_path}"
+    if leaf_prefix == "poi_" and not ctx.same_feature(leaf, "poi"):
+        yield "ida.include", f"Idea must include only its own feature Poiesis headers: {include_path}"
+    if leaf_prefix == "ida_" and not ctx.same_feature(leaf, "ida"):
+        yield "ida.include", f"Idea must not include other features' Idea headers: {include_path}"
+    if leaf_prefix == "cfg_" and leaf not in ctx.core_config_names:
+        yield "ida.include", f"Idea must not include cfg_ directly (except core contract): {include_path}"
+    if leaf_prefix in _LOWER_LAYER_PREFIXES:
+        yield "ida.include", f"Idea must not include lower layer/resource headers directly: {include_path}"
+
+
+def core_contract_validator(name: str, allowed_prx_poi: Callable[[IncludeContext], set[str]]) -> IncludeValidator:
+    """Build the shared poi_core/prx_core include rules; only the allowed PRX/POI set differs."""
+    rule = f"{name}.include"
+
+    def validate(leaf: str, leaf_prefix: str, include_path: str, ctx: IncludeContext) -> Iterator[tuple[str, str]]:
+        if leaf_prefix == "ida_" and leaf not in ctx.ida_core_names:
+            yield rule, f"{name} must not include feature ideas: {include_path}"
+        if leaf_prefix in ("prx_", "poi_") and leaf not in allowed_prx_poi(ctx):
+            yield rule, f"{name} must not include feature PRX/POI headers: {include_path}"
+        if leaf_prefix in ("hal_", "bsp_"):
+            yield rule, f"{name} must not include platform headers directly: {include_path}"
+        if leaf_prefix == "cfg_" and leaf not in ctx.core_config_names:
+            yield rule, f"{name} may include only core contract headers: {include_path}"
+
+    return validate
+
+
+def feature_layer_validator(
+    rule: str,
+    label: str,
+    *,
+    forbidden: tuple[tuple[str, str], ...],
+    same_feature_only: tuple[tuple[str, str], ...],
+) -> IncludeValidator:
+    """Build the praxis/poiesis include rules.
+
+    *forbidden* lists (prefix, message) pairs that are always rejected;
+    *same_feature_only* lists (prefix, noun) pairs allowed only for the file's own feature.
+    """
+
+    def validate(leaf: str, leaf_prefix: str, include_path: str, ctx: IncludeContext) -> Iterator[tuple[str, str]]:
+        for role_prefix, message in forbidden:
+            if leaf_prefix == role_prefix:
+                yield rule, f"{label} must not include {message}: {include_path}"
+        for role_prefix, noun in same_feature_only:
+            if leaf_prefix == role_prefix and not ctx.same_feature(leaf, role_prefix[:-1]):
+                yield rule, f"{label} must not include other features' {noun}: {include_path}"
+        is_project_cfg = leaf in ctx.project_config_names
+        if (
+            leaf_prefix == "cfg_"
+            and leaf not in ctx.core_config_names
+            and not is_project_cfg
+            and not ctx.same_feature(leaf, "cfg")
+        ):
+            yield rule, f"{label} must not include other features' config: {include_path}"
+        if leaf_prefix == "db_" and not is_project_cfg and not ctx.same_feature(leaf, "db"):
+            yield rule, f"{label} must not include other features' database headers: {include_path}"
+
+    return validate
+
+
+def check_resource_include(leaf: str, leaf_prefix: str, include_path: str, ctx: IncludeContext) -> Iterator[tuple[str, str]]:
+    if leaf_prefix in _UPPER_LAYER_PREFIXES:
+        yield "resource.include", f"Resources must not include upper-layer headers: {include_path}"
+
+
+def check_module_include(leaf: str, leaf_prefix: str, include_path: str, ctx: IncludeContext) -> Iterator[tuple[str, str]]:
+    if leaf_prefix in _UPPER_LAYER_PREFIXES:
+        is_api_entry_bootstrap = ctx.is_under_api and leaf.startswith("ida_core_")
+        if not is_api_entry_bootstrap:
+            yield "module.include", f"Modules must not include upper-layer headers: {include_path}"
+    if leaf in ctx.project_resource_header_names and leaf not in ctx.core_config_names:
+        yield "module.resource", f"Modules must not include resources (cfg_/db_/stm_) directly: {include_path}"
+
+
+def check_bsp_direction_include(leaf: str, leaf_prefix: str, include_path: str, ctx: IncludeContext) -> Iterator[tuple[str, str]]:
+    if leaf_prefix == "hal_":
+        yield "platform.direction", f"BSP must not include HAL headers (direction is HAL -> BSP): {include_path}"
+
+
+def check_platform_include(leaf: str, leaf_prefix: str, include_path: str, ctx: IncludeContext) -> Iterator[tuple[str, str]]:
+    if leaf_prefix in _PLATFORM_FORBIDDEN_PREFIXES or (
+        leaf in ctx.project_resource_header_names and leaf not in ctx.core_config_names
+    ):
+        yield "platform.include", f"Platform must not include upper-layer/resource/module headers: {include_path}"
+
+
+# Role -> include validators, applied in order to every non-system include.
+# Roles without an entry have no include rules.
+ROLE_INCLUDE_VALIDATORS: dict[str, tuple[IncludeValidator, ...]] = {
+    "core_idea": (check_deps_path_include, check_core_idea_include),
+    "core_poiesis": (
+        check_deps_path_include,
+        core_contract_validator("poi_core", lambda ctx: ctx.poi_core_names),
+    ),
+    "core_praxis": (
+        check_deps_path_include,
+        core_contract_validator("prx_core", lambda ctx: ctx.prx_core_names | ctx.poi_core_names),
+    ),
+    "idea": (check_deps_path_include, check_idea_include),
+    "praxis": (
+        check_deps_path_include,
+        feature_layer_validator(
+            "prx.include",
+            "Praxis",
+            forbidden=(("ida_", "Idea headers"),),
+            same_feature_only=(("prx_", "Praxis"), ("poi_", "Poiesis")),
+        ),
+    ),
+    "poiesis": (
+        check_deps_path_include,
+        feature_layer_validator(
+            "poi.include",
+            "Poiesis",
+            forbidden=(("ida_", "Idea headers"), ("prx_", "Praxis headers (no reverse dependency)")),
+            same_feature_only=(("poi_", "Poiesis"),),
+        ),
+    ),
+    "feature_cfg": (check_resource_include,),
+    "feature_db": (check_resource_include,),
+    "datastream": (check_resource_include,),
+    "service": (check_module_include,),
+    "middleware": (check_module_include,),
+    "hal": (check_platform_include,),
+    "bsp": (check_bsp_direction_include, check_platform_include),
+}
+
+
 _VALID_API_ROLE_PREFIXES = {"app", "mdw", "hal", "svc", "bsp"}
 
 
@@ -291,7 +660,9 @@ def detect_unit_name(root_path: Path) -> str | None:
 
 def write_json_no_bom(path: Path, payload: dict[str, object]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2), encoding="utf-8")
+    # Stream the encoder's chunks instead of building the whole report string first.
+    with path.open("w", encoding="utf-8", buffering=1 << 20) as handle:
+        json.dump(payload, handle, ensure_ascii=False, indent=2)
 
 
 def stem_has_unit_suffix(stem: str, unit_name: str) -> bool:
@@ -331,32 +702,27 @@ def collect_build_evidence(repo_root: Path) -> list[dict[str, object]]:
     evidence: list[dict[str, object]] = []
     seen_files: set[Path] = set()
 
-    for pattern in BUILD_FILE_PATTERNS:
-        for path in repo_root.rglob(pattern):
-            if not path.is_file():
-                continue
-            if path in seen_files:
-                continue
-            if any(part.lower() in BUILD_SKIP_DIRS for part in path.parts):
-                continue
-            seen_files.add(path)
-            try:
-                lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
-            except OSError:
-                continue
+    for path in iter_build_files(repo_root):
+        if path in seen_files or not path.is_file():
+            continue
+        seen_files.add(path)
+        try:
+            lines = path.read_text(encoding="utf-8", errors="replace").splitlines()
+        except OSError:
+            continue
 
-            for line_no, line in enumerate(lines, start=1):
-                for kind, regex, message in BUILD_EVIDENCE_RULES:
-                    if regex.search(line):
-                        evidence.append(
-                            {
-                                "file": path,
-                                "line": line_no,
-                                "kind": kind,
-                                "message": message,
-                                "text": line.strip().lstrip("\ufeff"),
-                            }
-                        )
+        for line_no, line in enumerate(lines, start=1):
+            for kind, regex, message in BUILD_EVIDENCE_RULES:
+                if regex.search(line):
+                    evidence.append(
+                        {
+                            "file": path,
+                            "line": line_no,
+                            "kind": kind,
+                            "message": message,
+                            "text": line.strip().lstrip("\ufeff"),
+                        }
+                    )
     return evidence
 
 
@@ -370,7 +736,7 @@ def detect_platform_include_evidence(include_path: str, leaf: str) -> tuple[str,
     if PLATFORM_PATH_SEGMENT_RE.search(normalized):
         category = (
             "board"
-            if re.search(r"(^|/)(?:board|boards?|bsp|port|ports)(/|$)", lower_path)
+            if BOARD_PATH_SEGMENT_RE.search(lower_path)
             else "peripheral"
         )
         return (category, f"raw platform include path: {include_path}")
@@ -379,7 +745,7 @@ def detect_platform_include_evidence(include_path: str, leaf: str) -> tuple[str,
 
 def collect_platform_evidence(
     includes: list[dict[str, object]],
-    text: str,
+    symbol_evidence: list[dict[str, object]],
 ) -> list[dict[str, object]]:
     evidence: list[dict[str, object]] = []
 
@@ -398,6 +764,12 @@ def collect_platform_evidence(
             }
         )
 
+    evidence.extend(symbol_evidence)
+    return evidence
+
+
+def collect_platform_symbol_evidence(text: str) -> list[dict[str, object]]:
+    evidence: list[dict[str, object]] = []
     for category, regex, message in PLATFORM_SYMBOL_RULES:
         for match in regex.finditer(text):
             line_no = text.count("\n", 0, match.start()) + 1
@@ -412,6 +784,207 @@ def collect_platform_evidence(
     return evidence
 
 
+def collect_service_functions(text: str, suffix: str) -> list[list[object]]:
+    """Return ``[line, name]`` for svc_ exports/declarations lacking the Svc_ prefix."""
+    if suffix == ".c":
+        func_re = SVC_EXPORT_FUNC_RE
+    elif suffix == ".h":
+        func_re = SVC_HEADER_FUNC_DECL_RE
+    else:
+        return []
+    hits: list[list[object]] = []
+    for line_idx, raw_line in enumerate(text.splitlines(), start=1):
+        if raw_line[:1].isspace() or not raw_line.strip():
+            continue
+        if raw_line.lstrip().startswith(("#", "/", "*", "typedef")):
+            continue
+        m = func_re.match(raw_line)
+        if not m:
+            continue
+        func_name = m.group(1)
+        if func_name.startswith("Svc_"):
+            continue
+        hits.append([line_idx, func_name])
+    return hits
+
+
+def scan_source_text(text: str, file_name: str) -> dict[str, object]:
+    """Derive the per-file facts the rule checks need from one source file.
+
+    The result is plain JSON data so that it can be kept in the scan cache.
+    """
+    suffix = os.path.splitext(file_name)[1].lower()
+    is_poi = file_name.startswith("poi_")
+    prx_existence_condition, prx_domain_conditional = (
+        praxis_red_flag_facts(text) if file_name.startswith("prx_") else (False, False)
+    )
+    return {
+        "includes": get_includes_from_text(text),
+        "platformSymbols": collect_platform_symbol_evidence(text),
+        "codeLines": count_code_lines_from_text(text),
+        "serviceFunctions": collect_service_functions(text, suffix) if file_name.startswith("svc_") else [],
+        "domainConditionals": count_domain_conditionals(text) if is_poi else 0,
+        "poiWrappers": count_poi_wrappers(text) if is_poi else 0,
+        "prxExistenceCondition": prx_existence_condition,
+        "prxDomainConditional": prx_domain_conditional,
+    }
+
+
+def decode_source(data: bytes) -> str:
+    """Decode like ``Path.read_text(encoding="utf-8")``, including newline translation."""
+    return data.decode("utf-8").replace("\r\n", "\n").replace("\r", "\n")
+
+
+def compute_rules_version() -> str:
+    """Hash this script and the shared helpers so rule changes invalidate the scan cache."""
+    digest = hashlib.blake2b(digest_size=16)
+    script_dir = Path(__file__).resolve().parent
+    for name in (Path(__file__).name, "comsect1_gate_helpers.py"):
+        digest.update((script_dir / name).read_bytes())
+    return digest.hexdigest()
+
+
+def load_scan_cache(cache_path: Path, rules_version: str) -> dict[str, dict[str, object]]:
+    """Load cached per-file scans; a missing, unreadable or stale cache is empty."""
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("rulesVersion") != rules_version:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def save_scan_cache(cache_path: Path, rules_version: str, entries: dict[str, dict[str, object]]) -> None:
+    """Atomically replace the scan cache (last writer wins; entries are re-validated on load)."""
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(
+        json.dumps({"rulesVersion": rules_version, "files": entries}, ensure_ascii=False),
+        encoding="utf-8",
+    )
+    os.replace(tmp_path, cache_path)
+
+
+def read_and_scan(path_str: str) -> tuple[dict[str, object], int, int, str] | Exception:
+    """Read, hash and scan one file; returns the exception instead of raising.
+
+    Runs in process-pool workers, so arguments and results stay picklable.
+    """
+    try:
+        st = os.stat(path_str)
+        with open(path_str, "rb") as fh:
+            data = fh.read()
+        scan = scan_source_text(decode_source(data), os.path.basename(path_str))
+    except Exception as exc:
+        return exc
+    return scan, st.st_mtime_ns, st.st_size, hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def scan_files(
+    paths: list[Path],
+    cache: dict[str, dict[str, object]] | None,
+    jobs: int,
+) -> dict[Path, dict[str, object] | Exception]:
+    """Scan *paths*, reusing *cache* entries and fanning cache misses out to *jobs* processes.
+
+    A cache entry is reused as-is when ``(mtime_ns, size)`` match; a re-read file
+    whose content hash is unchanged only refreshes the entry's stat.
+    """
+    results: dict[Path, dict[str, object] | Exception] = {}
+    pending: list[Path] = []
+    for path in paths:
+        if cache is not None:
+            entry = cache.get(str(path))
+            if entry:
+                try:
+                    st = path.stat()
+                except OSError as exc:
+                    results[path] = exc
+                    continue
+                if entry.get("mtimeNs") == st.st_mtime_ns and entry.get("size") == st.st_size:
+                    results[path] = entry["scan"]
+                    continue
+        pending.append(path)
+
+    pending_strs = [str(path) for path in pending]
+    if jobs > 1 and len(pending) >= PARALLEL_SCAN_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            outcomes = list(executor.map(read_and_scan, pending_strs, chunksize=32))
+    else:
+        outcomes = [read_and_scan(path_str) for path_str in pending_strs]
+
+    for path, key, outcome in zip(pending, pending_strs, outcomes):
+        if isinstance(outcome, Exception):
+            results[path] = outcome
+            continue
+        scan, mtime_ns, size, content_hash = outcome
+        if cache is not None:
+            entry = cache.get(key)
+            if entry and entry.get("hash") == content_hash:
+                entry["mtimeNs"] = mtime_ns
+                entry["size"] = size
+            else:
+                cache[key] = {"mtimeNs": mtime_ns, "size": size, "hash": content_hash, "scan": scan}
+        results[path] = scan
+    return results
+
+
+# Run-wide include-rule inputs, installed once per worker by the pool
+# initializer so each task carries only one file's role, feature and includes.
+_INCLUDE_RULE_SHARED: dict[str, object] = {}
+
+
+def init_include_rule_worker(shared: dict[str, object]) -> None:
+    _INCLUDE_RULE_SHARED.clear()
+    _INCLUDE_RULE_SHARED.update(shared)
+
+
+def check_file_includes(
+    task: tuple[str, str | None, bool, list[dict[str, object]]],
+) -> list[tuple[int, str, str]]:
+    """Apply the role's include validators to one file's scanned includes.
+
+    Returns ``(line, rule, message)`` errors in include order.
+    """
+    role, feature, is_under_api, includes = task
+    ctx = IncludeContext(feature=feature, is_under_api=is_under_api, **_INCLUDE_RULE_SHARED)
+    validators = ROLE_INCLUDE_VALIDATORS[role]
+    errors: list[tuple[int, str, str]] = []
+    for inc in includes:
+        if SYSTEM_INCLUDE_REGEX.match(str(inc["Raw"])):
+            continue
+        line_no = int(inc["Line"])
+        include_path = str(inc["IncludePath"])
+        leaf = str(inc["Leaf"])
+        leaf_prefix = include_leaf_prefix(leaf)
+        for validate in validators:
+            for rule, message in validate(leaf, leaf_prefix, include_path, ctx):
+                errors.append((line_no, rule, message))
+    return errors
+
+
+def check_includes(
+    tasks: list[tuple[str, str | None, bool, list[dict[str, object]]]],
+    shared: dict[str, object],
+    jobs: int,
+) -> list[list[tuple[int, str, str]]]:
+    """Run check_file_includes over *tasks*, fanning out to *jobs* processes for large runs.
+
+    *shared* reaches each worker once through the pool initializer instead of
+    being pickled with every task.
+    """
+    if jobs > 1 and len(tasks) >= PARALLEL_SCAN_MIN_FILES:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=init_include_rule_worker,
+            initargs=(shared,),
+        ) as executor:
+            return list(executor.map(check_file_includes, tasks, chunksize=32))
+    init_include_rule_worker(shared)
+    return [check_file_includes(task) for task in tasks]
+
+
 def is_platform_declared_role(role: str) -> bool:
     return role in {"hal", "bsp"}
 
@@ -419,8 +992,8 @@ def is_platform_declared_role(role: str) -> bool:
 def has_legacy_platform_build_path(text: str) -> bool:
     normalized = text.replace("\\", "/")
     return bool(
-        re.search(r"(^|[\s\"'(<:=])(?:platform|ports?)/", normalized, re.IGNORECASE)
-        or re.search(r"/(?:platform|ports?)(/|$)", normalized, re.IGNORECASE)
+        LEGACY_PLATFORM_BUILD_ARG_RE.search(normalized)
+        or LEGACY_PLATFORM_BUILD_SEGMENT_RE.search(normalized)
         or PLATFORM_PORT_SEGMENT_RE.search(normalized)
         or LEGACY_PLATFORM_BUILD_PATH_RE.search(normalized)
     )
@@ -431,19 +1004,29 @@ def main() -> int:
     parser.add_argument("-Root", dest="root", required=True, help="Dedicated comsect1 root directory to scan")
     parser.add_argument("-RepoRoot", dest="repo_root", default=None, help="Repository/project root for build evidence scanning")
     parser.add_argument("-JsonOut", dest="json_out", default=None)
+    parser.add_argument("-UseCache", dest="use_cache", action="store_true",
+                        help=f"Reuse per-file scan results from <RepoRoot>/{SCAN_CACHE_NAME} for unchanged files")
+    parser.add_argument("-Jobs", dest="jobs", type=int, default=None,
+                        help="Worker processes for reading/scanning files (default: CPU count; 1 disables)")
     args = parser.parse_args()
 
+    for cached in (_abspath, _path_zones, _feature_from_full_path, get_role_info, include_leaf_prefix):
+        cached.cache_clear()
+
     root_path = Path(args.root).resolve()
     if not root_path.is_dir():
         raise RuntimeError(f"Root folder not found: {root_path}")
 
     repo_root = discover_repo_root(root_path, args.repo_root)
+    scan_cache_path = repo_root / SCAN_CACHE_NAME
+    rules_version = compute_rules_version() if args.use_cache else ""
+    scan_cache = load_scan_cache(scan_cache_path, rules_version) if args.use_cache else None
     unit_identity = detect_unit_identity(root_path)
     unit_name = unit_identity.get("resolved_unit")
     if not isinstance(unit_name, str):
         unit_name = None
 
-    findings: list[dict[str, object]] = []
+    findings = FindingTable()
 
     def err(file_path: str | Path, line: int, rule: str, message: str) -> None:
         add_finding(findings, "error", file_path, line, rule, message)
@@ -457,15 +1040,8 @@ def main() -> int:
 
     api_dir = root_path / "api"
     infra_bootstrap_dir = root_path / "infra" / "bootstrap"
-    infra_service_dir = root_path / "infra" / "service"
-    infra_hal_dir = root_path / "infra" / "platform" / "hal"
-    infra_bsp_dir = root_path / "infra" / "platform" / "bsp"
     deps_root_dir = root_path / "deps"
-    deps_extern_dir = root_path / "deps" / "extern"
-    deps_middleware_dir = root_path / "deps" / "middleware"
-    project_features_dir = root_path / "project" / "features"
     project_config_dir = root_path / "project" / "config"
-    project_datastreams_dir = root_path / "project" / "datastreams"
 
     if not infra_bootstrap_dir.is_dir():
         err(str(root_path), 1, "layout.required", f"Missing required infra bootstrap path: {infra_bootstrap_dir}")
@@ -541,106 +1117,98 @@ def main() -> int:
     # --- Comprehensive folder tree checks (Section 7.3, 7.5, 7.10) ---
     verify_folder_structure(root_path, findings)
 
-    source_files = collect_source_files(root_path, SOURCE_EXTENSIONS)
+    # One pass classifies every file (role, feature, zones); the derived sets
+    # and the rule loop below all read from these records.
+    metas = [
+        build_file_meta(f, root_path, unit_name)
+        for f in collect_source_files(root_path, SOURCE_EXTENSIONS)
+    ]
     # Exclude deps/ — external dependency code is verified by its own gate.
     # The consumer project gate checks only project-owned code (project/ and infra/).
     # deps/ is a Dependency Repository (§7.3), not project-owned code.
-    source_files = [
-        f for f in source_files
-        if not test_is_under_path(f, deps_root_dir)
-    ]
-    if not source_files:
+    metas = [meta for meta in metas if "deps" not in meta.under_zones]
+    if not metas:
         err(str(root_path), 1, "layout.required", f"No source files found under: {root_path}")
 
     build_evidence = collect_build_evidence(repo_root)
 
-    header_feature_owners: dict[str, set[str]] = {}
-    for candidate in source_files:
-        if candidate.suffix.lower() not in {".h", ".hpp"}:
-            continue
-        owner_feature = get_feature_from_path(candidate)
-        if not owner_feature:
-            continue
-        header_feature_owners.setdefault(candidate.name, set()).add(owner_feature)
-
-    project_resource_header_names: set[str] = set()
-    for candidate in source_files:
-        if candidate.suffix.lower() not in {".h", ".hpp"}:
-            continue
-        candidate_role, _ = get_role_info(candidate.name, unit_name)
-        if candidate_role not in {"feature_cfg", "feature_db", "datastream"}:
-            continue
-
-        candidate_path = full_path(candidate)
-        candidate_is_under_project_features = test_is_under_path(candidate_path, project_features_dir)
-        candidate_is_under_project_config = test_is_under_path(candidate_path, project_config_dir)
-        candidate_is_under_project_datastreams = test_is_under_path(candidate_path, project_datastreams_dir)
-        candidate_is_under_deps_extern = test_is_under_path(candidate_path, deps_extern_dir)
-        candidate_is_under_deps_middleware = test_is_under_path(candidate_path, deps_middleware_dir)
-        candidate_is_nested_deps_unit = candidate_is_under_deps_extern or candidate_is_under_deps_middleware
-
-        candidate_has_project_features_segment = test_contains_subpath(candidate_path, "\\\\project\\\\features\\\\")
-        candidate_has_project_config_segment = test_contains_subpath(candidate_path, "\\\\project\\\\config\\\\")
-        candidate_has_project_datastreams_segment = test_contains_subpath(candidate_path, "\\\\project\\\\datastreams\\\\")
+    header_metas = [meta for meta in metas if meta.is_header]
 
-        candidate_is_under_any_project_features = candidate_is_under_project_features or (
-            candidate_is_nested_deps_unit and candidate_has_project_features_segment
-        )
-        candidate_is_under_any_project_config = candidate_is_under_project_config or (
-            candidate_is_nested_deps_unit and candidate_has_project_config_segment
-        )
-        candidate_is_under_any_project_datastreams = candidate_is_under_project_datastreams or (
-            candidate_is_nested_deps_unit and candidate_has_project_datastreams_segment
-        )
-
-        if (
-            candidate_is_under_any_project_features
-            or candidate_is_under_any_project_config
-            or candidate_is_under_any_project_datastreams
-        ):
-            project_resource_header_names.add(candidate.name)
-
-    for file in source_files:
-        full_file_path = full_path(file)
-        is_under_api = test_is_under_path(full_file_path, api_dir)
-
-        is_under_bootstrap = test_is_under_path(full_file_path, infra_bootstrap_dir)
-        is_under_service = test_is_under_path(full_file_path, infra_service_dir)
-        is_under_hal = test_is_under_path(full_file_path, infra_hal_dir)
-        is_under_bsp = test_is_under_path(full_file_path, infra_bsp_dir)
-        is_under_deps_extern = test_is_under_path(full_file_path, deps_extern_dir)
-        is_under_deps_middleware = test_is_under_path(full_file_path, deps_middleware_dir)
-        is_under_project_features = test_is_under_path(full_file_path, project_features_dir)
-        is_under_project_config = test_is_under_path(full_file_path, project_config_dir)
-        is_under_project_datastreams = test_is_under_path(full_file_path, project_datastreams_dir)
+    header_feature_owners: dict[str, set[str]] = {}
+    for meta in header_metas:
+        if meta.path_feature:
+            header_feature_owners.setdefault(meta.path.name, set()).add(meta.path_feature)
+
+    project_resource_header_names = {
+        meta.path.name
+        for meta in header_metas
+        if meta.role in {"feature_cfg", "feature_db", "datastream"}
+        and meta.any_zones & {"project_features", "project_config", "project_datastreams"}
+    }
 
+    # Read and scan every file the rule loop will inspect (roles other than
+    # invalid_prefix/unknown) up front; findings are still emitted in file order below.
+    scan_targets = [meta.path for meta in metas if meta.role not in {"invalid_prefix", "unknown"}]
+    jobs = args.jobs if args.jobs is not None else (os.cpu_count() or 1)
+    scan_results = scan_files(scan_targets, scan_cache, jobs)
+
+    # Include rules depend only on each file's scan plus the run-wide name sets,
+    # so they are evaluated up front as well (in parallel for large trees).
+    # Roles without include rules, and files without includes, are skipped.
+    include_metas = [
+        meta for meta in metas
+        if meta.role in ROLE_INCLUDE_VALIDATORS
+        and isinstance(scan_results.get(meta.path), dict)
+        and scan_results[meta.path]["includes"]
+    ]
+    include_errors = dict(zip(
+        (meta.path for meta in include_metas),
+        check_includes(
+            [
+                (meta.role, meta.feature, "api" in meta.under_zones, scan_results[meta.path]["includes"])
+                for meta in include_metas
+            ],
+            {
+                "core_config_names": core_config_names,
+                "project_config_names": project_config_names,
+                "ida_core_names": ida_core_names,
+                "prx_core_names": prx_core_names,
+                "poi_core_names": poi_core_names,
+                "header_feature_owners": header_feature_owners,
+                "project_resource_header_names": project_resource_header_names,
+            },
+            jobs,
+        ),
+    ))
+
+    scans: dict[Path, dict[str, object]] = {}
+    for meta in metas:
+        file = meta.path
+        under_zones = meta.under_zones
+        nested_zones = meta.nested_zones
+        any_zones = meta.any_zones
+        is_under_api = "api" in under_zones
+
+        is_under_bootstrap = "bootstrap" in under_zones
+        is_under_service = "service" in under_zones
+        is_under_hal = "hal" in under_zones
+        is_under_bsp = "bsp" in under_zones
+        is_under_deps_extern = "deps_extern" in under_zones
+        is_under_deps_middleware = "deps_middleware" in under_zones
+        is_under_project_features = "project_features" in under_zones
+        is_under_project_config = "project_config" in under_zones
+        is_under_project_datastreams = "project_datastreams" in under_zones
         is_nested_deps_unit = is_under_deps_extern or is_under_deps_middleware
-        has_project_features_segment = test_contains_subpath(full_file_path, "\\\\project\\\\features\\\\")
-        has_project_config_segment = test_contains_subpath(full_file_path, "\\\\project\\\\config\\\\")
-        has_project_datastreams_segment = test_contains_subpath(full_file_path, "\\\\project\\\\datastreams\\\\")
-        has_infra_bootstrap_segment = test_contains_subpath(full_file_path, "\\\\infra\\\\bootstrap\\\\")
-        has_infra_service_segment = test_contains_subpath(full_file_path, "\\\\infra\\\\service\\\\")
-        has_infra_hal_segment = test_contains_subpath(full_file_path, "\\\\infra\\\\platform\\\\hal\\\\")
-        has_infra_bsp_segment = test_contains_subpath(full_file_path, "\\\\infra\\\\platform\\\\bsp\\\\")
-
-        is_under_any_bootstrap = is_under_bootstrap or (is_nested_deps_unit and has_infra_bootstrap_segment)
-        is_under_any_service = is_under_service or (is_nested_deps_unit and has_infra_service_segment)
-        is_under_any_hal = is_under_hal or (is_nested_deps_unit and has_infra_hal_segment)
-        is_under_any_bsp = is_under_bsp or (is_nested_deps_unit and has_infra_bsp_segment)
-        is_under_any_project_features = is_under_project_features or (
-            is_nested_deps_unit and has_project_features_segment
-        )
-        is_under_any_project_config = is_under_project_config or (
-            is_nested_deps_unit and has_project_config_segment
-        )
-        is_under_any_project_datastreams = is_under_project_datastreams or (
-            is_nested_deps_unit and has_project_datastreams_segment
-        )
 
-        role, feature = get_role_info(file.name, unit_name)
-        feature_from_path = get_feature_from_path(full_file_path)
-        if feature_from_path:
-            feature = feature_from_path
+        is_under_any_bootstrap = "bootstrap" in any_zones
+        is_under_any_service = "service" in any_zones
+        is_under_any_hal = "hal" in any_zones
+        is_under_any_bsp = "bsp" in any_zones
+        is_under_any_project_features = "project_features" in any_zones
+        is_under_any_project_config = "project_config" in any_zones
+        is_under_any_project_datastreams = "project_datastreams" in any_zones
+
+        role = meta.role
 
         if role == "invalid_prefix":
             err(str(file), 1, "naming.prefix", "Invalid role prefix 'inf_'. Keep role prefixes (ida_/prx_/poi_/mdw_/svc_/hal_/bsp_/stm_/cfg_/db_).")
@@ -694,7 +1262,7 @@ def main() -> int:
         elif role == "poiesis" and not is_under_any_project_features:
             err(str(file), 1, "path.project_feature", "poi_* feature files must be located under /project/features (root or nested architecture unit).")
         elif role == "feature_cfg":
-            is_external_non_fractal_cfg = is_nested_deps_unit and not has_project_features_segment and not has_project_config_segment
+            is_external_non_fractal_cfg = is_nested_deps_unit and not nested_zones & {"project_features", "project_config"}
             if not is_external_non_fractal_cfg and file.name.lower() not in cfg_core_names:
                 is_project_anchor_cfg = file.name.lower() == "cfg_project.h" or (
                     unit_name and file.name.lower() == f"cfg_project_{unit_name}.h"
@@ -705,7 +1273,7 @@ def main() -> int:
                 elif not is_under_any_project_features and not is_under_any_project_config:
                     err(str(file), 1, "path.feature_resource", f"cfg_* feature files must be located under /project/features/ or /project/config/ (root or nested architecture unit): {file.name}")
         elif role == "feature_db":
-            is_external_non_fractal_db = is_nested_deps_unit and not has_project_features_segment and not has_project_config_segment
+            is_external_non_fractal_db = is_nested_deps_unit and not nested_zones & {"project_features", "project_config"}
             if not is_external_non_fractal_db:
                 if file.name.lower() == "db_project.h":
                     if not is_under_any_project_config:
@@ -715,14 +1283,14 @@ def main() -> int:
         elif role == "datastream" and not is_under_any_project_datastreams and not is_under_deps_middleware and not is_under_deps_extern:
             err(str(file), 1, "path.datastream", f"stm_* files must be located under /project/datastreams/, /deps/middleware/, or /deps/extern/: {file.name}")
 
-        try:
-            text = file.read_text(encoding="utf-8")
-        except Exception as exc:
-            err(str(file), 1, "read", f"Failed to read file: {exc}")
+        scan = scan_results[file]
+        if isinstance(scan, Exception):
+            err(str(file), 1, "read", f"Failed to read file: {scan}")
             continue
+        scans[file] = scan
 
-        includes = get_includes_from_text(text)
-        platform_evidence = collect_platform_evidence(includes, text)
+        includes = scan["includes"]
+        platform_evidence = collect_platform_evidence(includes, scan["platformSymbols"])
         platform_categories = {str(item["category"]) for item in platform_evidence}
         if "board" in platform_categories and "peripheral" in platform_categories:
             mixed_line = min(int(item["line"]) for item in platform_evidence)
@@ -747,156 +1315,32 @@ def main() -> int:
                     f"Non-platform file owns raw platform coupling ({item['message']}). Extract this responsibility to /infra/platform/hal or /infra/platform/bsp.",
                 )
 
-        for inc in includes:
-            line_no = int(inc["Line"])
-            include_path = str(inc["IncludePath"])
-            leaf = str(inc["Leaf"])
-            raw = str(inc["Raw"])
-
-            if SYSTEM_INCLUDE_REGEX.match(raw):
-                continue
-
-            if role in {"core_idea", "core_poiesis", "core_praxis", "idea", "praxis", "poiesis"}:
-                if re.search(r"(^|[\\/])deps([\\/]|$)", include_path):
-                    err(str(file), line_no, "include.deps_path", f"Do not include dependency repository paths directly from core/project layers: {include_path}")
-
-            is_core_cfg = leaf in core_config_names
-            is_project_cfg = leaf in project_config_names
-            if role == "core_idea":
-                if re.match(r"^prx_", leaf) and leaf not in prx_core_names:
-                    err(str(file), line_no, "ida_core.include", f"ida_core must not include feature praxis: {include_path}")
-                if re.match(r"^poi_", leaf) and leaf not in poi_core_names:
-                    err(str(file), line_no, "ida_core.include", f"ida_core must not include feature poiesis: {include_path}")
-                if re.match(r"^cfg_", leaf) and not is_core_cfg:
-                    err(str(file), line_no, "ida_core.include", f"ida_core may include only core contract headers: {include_path}")
-                if re.match(r"^(db_|stm_|mdw_|svc_|hal_|bsp_)", leaf):
-                    err(str(file), line_no, "ida_core.include", f"ida_core must not include lower layer/resource headers directly: {include_path}")
-
-            elif role == "idea":
-                if re.match(r"^prx_", leaf) and not test_is_same_feature_include(leaf, "prx", feature, header_feature_owners):
-                    err(str(file), line_no, "ida.include", f"Idea must include only its own feature Praxis headers: {include_path}")
-                if re.match(r"^poi_", leaf) and not test_is_same_feature_include(leaf, "poi", feature, header_feature_owners):
-                    err(str(file), line_no, "ida.include", f"Idea must include only its own feature Poiesis headers: {include_path}")
-                if re.match(r"^ida_", leaf) and not test_is_same_feature_include(leaf, "ida", feature, header_feature_owners):
-                    err(str(file), line_no, "ida.include", f"Idea must not include other features' Idea headers: {include_path}")
-                if re.match(r"^cfg_", leaf) and not is_core_cfg:
-                    err(str(file), line_no, "ida.include", f"Idea must not include cfg_ directly (except core contract): {include_path}")
-                if re.match(r"^(db_|stm_|mdw_|svc_|hal_|bsp_)", leaf):
-                    err(str(file), line_no, "ida.include", f"Idea must not include lower layer/resource headers directly: {include_path}")
-
-            elif role == "core_poiesis":
-                if re.match(r"^ida_", leaf) and leaf not in ida_core_names:
-                    err(str(file), line_no, "poi_core.include", f"poi_core must not include feature ideas: {include_path}")
-                if re.match(r"^(prx_|poi_)", leaf) and leaf not in poi_core_names:
-                    err(str(file), line_no, "poi_core.include", f"poi_core must not include feature PRX/POI headers: {include_path}")
-                if re.match(r"^(hal_|bsp_)", leaf):
-                    err(str(file), line_no, "poi_core.include", f"poi_core must not include platform headers directly: {include_path}")
-                if re.match(r"^cfg_", leaf) and not is_core_cfg:
-                    err(str(file), line_no, "poi_core.include", f"poi_core may include only core contract headers: {include_path}")
-
-            elif role == "core_praxis":
-                if re.match(r"^ida_", leaf) and leaf not in ida_core_names:
-                    err(str(file), line_no, "prx_core.include", f"prx_core must not include feature ideas: {include_path}")
-                if re.match(r"^(prx_|poi_)", leaf) and leaf not in (prx_core_names | poi_core_names):
-                    err(str(file), line_no, "prx_core.include", f"prx_core must not include feature PRX/POI headers: {include_path}")
-                if re.match(r"^(hal_|bsp_)", leaf):
-                    err(str(file), line_no, "prx_core.include", f"prx_core must not include platform headers directly: {include_path}")
-                if re.match(r"^cfg_", leaf) and not is_core_cfg:
-                    err(str(file), line_no, "prx_core.include", f"prx_core may include only core contract headers: {include_path}")
-
-            elif role == "praxis":
-                if re.match(r"^ida_", leaf):
-                    err(str(file), line_no, "prx.include", f"Praxis must not include Idea headers: {include_path}")
-                if re.match(r"^prx_", leaf) and not test_is_same_feature_include(leaf, "prx", feature, header_feature_owners):
-                    err(str(file), line_no, "prx.include", f"Praxis must not include other features' Praxis: {include_path}")
-                if re.match(r"^poi_", leaf) and not test_is_same_feature_include(leaf, "poi", feature, header_feature_owners):
-                    err(str(file), line_no, "prx.include", f"Praxis must not include other features' Poiesis: {include_path}")
-                if re.match(r"^cfg_", leaf) and not is_core_cfg and not is_project_cfg and not test_is_same_feature_include(leaf, "cfg", feature, header_feature_owners):
-                    err(str(file), line_no, "prx.include", f"Praxis must not include other features' config: {include_path}")
-                if re.match(r"^db_", leaf) and not is_project_cfg and not test_is_same_feature_include(leaf, "db", feature, header_feature_owners):
-                    err(str(file), line_no, "prx.include", f"Praxis must not include other features' database headers: {include_path}")
-
-            elif role == "poiesis":
-                if re.match(r"^ida_", leaf):
-                    err(str(file), line_no, "poi.include", f"Poiesis must not include Idea headers: {include_path}")
-                if re.match(r"^prx_", leaf):
-                    err(str(file), line_no, "poi.include", f"Poiesis must not include Praxis headers (no reverse dependency): {include_path}")
-                if re.match(r"^poi_", leaf) and not test_is_same_feature_include(leaf, "poi", feature, header_feature_owners):
-                    err(str(file), line_no, "poi.include", f"Poiesis must not include other features' Poiesis: {include_path}")
-                if re.match(r"^cfg_", leaf) and not is_core_cfg and not is_project_cfg and not test_is_same_feature_include(leaf, "cfg", feature, header_feature_owners):
-                    err(str(file), line_no, "poi.include", f"Poiesis must not include other features' config: {include_path}")
-                if re.match(r"^db_", leaf) and not is_project_cfg and not test_is_same_feature_include(leaf, "db", feature, header_feature_owners):
-                    err(str(file), line_no, "poi.include", f"Poiesis must not include other features' database headers: {include_path}")
-
-            if role in {"feature_cfg", "feature_db", "datastream"}:
-                if re.match(r"^(ida_|prx_|poi_)", leaf):
-                    err(str(file), line_no, "resource.include", f"Resources must not include upper-layer headers: {include_path}")
-
-            if role in {"service", "middleware"}:
-                if re.match(r"^(ida_|prx_|poi_)", leaf):
-                    is_api_entry_bootstrap = is_under_api and re.match(r"^ida_core_", leaf)
-                    if not is_api_entry_bootstrap:
-                        err(str(file), line_no, "module.include", f"Modules must not include upper-layer headers: {include_path}")
-                if leaf in project_resource_header_names and not is_core_cfg:
-                    err(str(file), line_no, "module.resource", f"Modules must not include resources (cfg_/db_/stm_) directly: {include_path}")
-
-            if role in {"hal", "bsp"}:
-                if role == "bsp" and re.match(r"^hal_", leaf):
-                    err(str(file), line_no, "platform.direction", f"BSP must not include HAL headers (direction is HAL -> BSP): {include_path}")
-                is_forbidden_platform_include = bool(
-                    re.match(r"^(ida_|prx_|poi_|mdw_|svc_)", leaf)
-                    or (leaf in project_resource_header_names and not is_core_cfg)
-                )
-                if is_forbidden_platform_include:
-                    err(str(file), line_no, "platform.include", f"Platform must not include upper-layer/resource/module headers: {include_path}")
+        for line_no, rule, message in include_errors.get(file, ()):
+            err(str(file), line_no, rule, message)
 
         # --- Rule: naming.service_export ---
         # Non-static function definitions in svc_ .c files must use Svc_ prefix
         if role == "service" and file.suffix.lower() == ".c":
-            for line_idx, raw_line in enumerate(text.splitlines(), start=1):
-                if raw_line[:1].isspace() or not raw_line.strip():
-                    continue
-                if raw_line.lstrip().startswith(("#", "/", "*", "typedef")):
-                    continue
-                m = SVC_EXPORT_FUNC_RE.match(raw_line)
-                if not m:
-                    continue
-                func_name = m.group(1)
-                if func_name.startswith("Svc_"):
-                    continue
+            for line_idx, func_name in scan["serviceFunctions"]:
                 err(str(file), line_idx, "naming.service_export",
                     f"Non-standard export '{func_name}'. Service-layer exports must use Svc_<Module>_ prefix.")
 
         # --- Rule: naming.service_header_export (advisory) ---
         # Function declarations in svc_ .h files should use Svc_ prefix
         if role == "service" and file.suffix.lower() == ".h":
-            for line_idx, raw_line in enumerate(text.splitlines(), start=1):
-                if raw_line[:1].isspace() or not raw_line.strip():
-                    continue
-                if raw_line.lstrip().startswith(("#", "/", "*", "typedef")):
-                    continue
-                m = SVC_HEADER_FUNC_DECL_RE.match(raw_line)
-                if not m:
-                    continue
-                func_name = m.group(1)
-                if func_name.startswith("Svc_"):
-                    continue
+            for line_idx, func_name in scan["serviceFunctions"]:
                 warn(str(file), line_idx, "naming.service_header_export",
                     f"Non-standard declaration '{func_name}'. Service header exports should use Svc_<Module>_ prefix.")
 
         # --- Rule: structure.dead_shell ---
         # Service .c files with fewer than 3 code lines are dead shells
         if is_under_any_service and file.suffix.lower() == ".c":
-            code_lines = count_code_lines(file)
+            code_lines = int(scan["codeLines"])
             if code_lines < 3:
                 err(str(file), 1, "structure.dead_shell",
                     f"Service file contains only {code_lines} code line(s). Remove empty shell files.")
 
-    has_platform_implementation = any(
-        test_is_under_path(full_path(candidate), infra_hal_dir)
-        or test_is_under_path(full_path(candidate), infra_bsp_dir)
-        for candidate in source_files
-    )
+    has_platform_implementation = any(meta.under_zones & {"hal", "bsp"} for meta in metas)
 
     for item in build_evidence:
         build_file = Path(str(item["file"]))
@@ -922,27 +1366,34 @@ def main() -> int:
             )
 
     # Pre-group .c files by architectural role for shared helpers
-    c_files = [f for f in source_files if f.suffix.lower() == ".c"]
-    ida_files = [f for f in c_files if get_role_info(f.name, unit_name)[0] == "idea"]
-    prx_files = [f for f in c_files if get_role_info(f.name, unit_name)[0] == "praxis"]
-    poi_files = [f for f in c_files if get_role_info(f.name, unit_name)[0] == "poiesis"]
-    service_files = [f for f in c_files if get_role_info(f.name, unit_name)[0] == "service"]
+    c_metas = [meta for meta in metas if meta.path.suffix.lower() == ".c"]
+    files_by_role: dict[str, list[Path]] = {"idea": [], "praxis": [], "poiesis": [], "service": []}
+    for meta in c_metas:
+        group = files_by_role.get(meta.role)
+        if group is not None:
+            group.append(meta.path)
+    ida_files = files_by_role["idea"]
+    prx_files = files_by_role["praxis"]
+    poi_files = files_by_role["poiesis"]
+    service_files = files_by_role["service"]
     internal_impl_files = [
-        f for f in c_files
-        if test_is_under_path(full_path(f), infra_bootstrap_dir)
-        or test_is_under_path(full_path(f), infra_service_dir)
-        or test_is_under_path(full_path(f), project_features_dir)
+        meta.path for meta in c_metas
+        if meta.under_zones & {"bootstrap", "service", "project_features"}
     ]
 
     # Stage: Orphan Datastream detection (advisory)
     stm_headers = [
-        f for f in source_files
-        if f.suffix.lower() == ".h" and get_role_info(f.name, unit_name)[0] == "datastream"
+        meta.path for meta in metas
+        if meta.path.suffix.lower() == ".h" and meta.role == "datastream"
     ]
     if stm_headers:
         # Collect all includes from prx_/poi_ .c files to find stm_ consumers/producers
         prx_poi_includes: set[str] = set()
         for pf in prx_files + poi_files:
+            cached_scan = scans.get(pf)
+            if cached_scan is not None:
+                prx_poi_includes.update(str(inc["Leaf"]).lower() for inc in cached_scan["includes"])
+                continue
             try:
                 text = pf.read_text(encoding="utf-8", errors="replace")
                 for inc in get_includes_from_text(text):
@@ -957,39 +1408,74 @@ def main() -> int:
                     "Verify it has active producers/consumers; remove if obsolete.",
                 )
 
+    def count_lines(path: Path) -> int:
+        scan = scans.get(path)
+        return int(scan["codeLines"]) if scan is not None else count_code_lines(path)
+
+    def count_conditionals(path: Path) -> int:
+        scan = scans.get(path)
+        return int(scan["domainConditionals"]) if scan is not None else count_file_domain_conditionals(path)
+
+    def poi_wrapper_count(path: Path) -> int:
+        scan = scans.get(path)
+        return int(scan["poiWrappers"]) if scan is not None else count_poi_wrappers(read_source_text(path))
+
+    def praxis_facts(path: Path) -> tuple[bool, bool]:
+        scan = scans.get(path)
+        if scan is None:
+            return praxis_red_flag_facts(read_source_text(path))
+        return bool(scan["prxExistenceCondition"]), bool(scan["prxDomainConditional"])
+
     # Stage: Layer Balance Invariant (v1.0.1, error severity)
     verify_layer_balance(
         ida_files, poi_files, findings,
-        extract_feature=get_feature_from_path, count_lines=count_code_lines,
+        extract_feature=get_feature_from_path, count_lines=count_lines,
+        count_conditionals=count_conditionals,
     )
 
     # Stage: Red Flag heuristics (advisory only)
     verify_red_flags_common(
         ida_files, prx_files, poi_files, findings,
-        count_lines=count_code_lines,
+        count_lines=count_lines,
         extract_feature=get_feature_from_path,
+        count_conditionals=count_conditionals,
+        poi_wrapper_count=poi_wrapper_count,
+        praxis_facts=praxis_facts,
     )
     verify_service_ownership_common(
         service_files, internal_impl_files, findings,
-        count_lines=count_code_lines,
+        count_lines=count_lines,
     )
 
-    errors = [f for f in findings if f["severity"] == "error"]
-    warnings = [f for f in findings if f["severity"] == "warning"]
+    if scan_cache is not None:
+        # Drop entries for files under this root that no longer exist or were excluded.
+        root_prefix = str(root_path) + os.sep
+        scanned = {str(f) for f in scans}
+        kept = {
+            key: entry for key, entry in scan_cache.items()
+            if key in scanned or not key.startswith(root_prefix)
+        }
+        try:
+            save_scan_cache(scan_cache_path, rules_version, kept)
+        except OSError as exc:
+            print(f"WARNING: could not write scan cache {scan_cache_path}: {exc}", file=sys.stderr)
+
+    error_count = findings.count("error")
+    warning_count = findings.count("warning")
 
     print(f"comsect1 code verification complete: {root_path}")
-    print(f"Errors: {len(errors)}")
-    if warnings:
-        print(f"Warnings (advisory): {len(warnings)}")
-    for e in sorted(errors, key=lambda item: (str(item["file"]), int(item["line"]), str(item["rule"]))):
+    print(f"Errors: {error_count}")
+    if warning_count:
+        print(f"Warnings (advisory): {warning_count}")
+    for e in findings.records("error", sort=True):
         print(f"- {e['file']}:{e['line']} [{e['rule']}] {e['message']}")
-    for w in sorted(warnings, key=lambda item: (str(item["file"]), int(item["line"]), str(item["rule"]))):
+    for w in findings.records("warning", sort=True):
         print(f"  (advisory) {w['file']}:{w['line']} [{w['rule']}] {w['message']}")
 
-    if errors:
-        print(f"\nGate FAILED -- {len(errors)} error(s) must be resolved.")
-    elif warnings:
-        print(f"\nGate passed -- {len(warnings)} advisory warning(s) for review.")
+    if error_count:
+        print(f"\nGate FAILED -- {error_count} error(s) must be resolved.")
+    elif warning_count:
+        print(f"\nGate passed -- {warning_count} advisory warning(s) for review.")
     else:
         print("\nGate passed -- no issues found.")
 
@@ -998,14 +1484,14 @@ def main() -> int:
             "generatedAtUtc": dt.datetime.now(dt.timezone.utc).isoformat().replace("+00:00", "Z"),
             "repoRoot": str(repo_root),
             "rootPath": str(root_path),
-            "errorsCount": len(errors),
-            "warningsCount": len(warnings),
-            "findings": findings,
+            "errorsCount": error_count,
+            "warningsCount": warning_count,
+            "findings": findings.records(),
         }
         write_json_no_bom(Path(args.json_out), report)
         print(f"JSON report: {args.json_out}")
 
-    return 2 if errors else 0
+    return 2 if error_count else 0
 
 
 if __name__ == "__main__":
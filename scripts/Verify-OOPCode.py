@@ -9,7 +9,7 @@ Equivalent to Verify-Comsect1Code.py for C/C++ projects.
 See: specs/A2_oop_adaptation.md (Appendix B)
 
 Usage:
-    python Verify-OOPCode.py -Root <comsect1_root> [-Extensions .vb,.cs] [-ReportPath <path>]
+    python Verify-OOPCode.py -Root <comsect1_root> [-Extensions .vb,.cs] [-ReportPath <path>] [-Jobs N] [-UseCache]
 
 Exit codes:
     0 - Gate passed (no violations)
@@ -17,17 +17,26 @@ Exit codes:
 """
 
 import argparse
+import hashlib
 import json
+import os
 import re
 import sys
-from datetime import datetime, timezone
-from functools import partial
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import Iterator, Optional
 
 from comsect1_gate_helpers import (
+    OTHER_LINE_BREAK_RE,
+    FindingTable,
     add_finding,
     collect_source_files,
-    count_code_lines as _count_code_lines,
+    count_code_lines_from_text as _count_code_lines_from_text,
+    count_domain_conditionals,
+    iter_match_line_numbers,
+    read_source_text,
     validate_comsect1_root_boundary,
     verify_folder_structure,
     verify_layer_balance,
@@ -39,8 +48,13 @@ from comsect1_gate_helpers import (
 # ---------------------------------------------------------------------------
 DEFAULT_EXTENSIONS = {".vb", ".cs"}
 
+# Below this many layer files a process pool costs more than it saves
+PARALLEL_SCAN_MIN_FILES = 64
+# Per-file Stage 1-3 results (-UseCache), stored at the comsect1 root.
+CHECK_CACHE_NAME = ".comsect1-oop-verify-cache.json"
+
 # OOP-specific code line counter: handle VB.NET single-quote comments
-count_code_lines = partial(_count_code_lines, line_comment_prefixes=("//", "'"))
+count_code_lines_from_text = partial(_count_code_lines_from_text, line_comment_prefixes=("//", "'"))
 
 # ---------------------------------------------------------------------------
 # Role detection: filename prefix -> architectural role
@@ -54,6 +68,10 @@ ROLE_PREFIXES = {
 # Shared resource prefixes: these are NOT features and are excluded from
 # cross-feature reference checks (A2.5.2: Shared Domain Utilities)
 SHARED_RESOURCE_PREFIXES = {"cfg_", "db_", "stm_", "svc_", "mdw_", "hal_", "bsp_"}
+_SHARED_RESOURCE_PREFIX_TUPLE = tuple(SHARED_RESOURCE_PREFIXES)
+
+# All role prefixes have this length, so a name's role is one dict lookup
+_ROLE_PREFIX_LEN = 4
 
 # ---------------------------------------------------------------------------
 # Rules for the 'idea' layer (A2.6.1: Idea importing external namespace)
@@ -85,26 +103,118 @@ IDA_FORBIDDEN_CALLS = {
     "ida-no-processstart": (r"\bProcess\.Start\s*\(", "Process.Start (OS shell call)"),
 }
 
+# Compiled once at import: (rule ID, regex, human message), in rule order
+IDA_IMPORT_RULES_VB = [(rid, re.compile(pat, re.IGNORECASE), msg)
+                       for rid, (pat, msg) in IDA_FORBIDDEN_IMPORTS_VB.items()]
+IDA_IMPORT_RULES_CS = [(rid, re.compile(pat, re.IGNORECASE), msg)
+                       for rid, (pat, msg) in IDA_FORBIDDEN_IMPORTS_CS.items()]
+IDA_CALL_RULES = [(rid, re.compile(pat), msg)
+                  for rid, (pat, msg) in IDA_FORBIDDEN_CALLS.items()]
+
+
+def _build_ida_line_prefilter(import_rules: dict, *, whole_text: bool = False) -> re.Pattern:
+    """Fuse every import (case-insensitive) and call pattern into one alternation.
+
+    A single search per line rejects the common clean line; only lines that hit
+    are re-checked rule by rule, because one line may violate several rules
+    (e.g. 'Imports System.IO.Ports' is both ida-no-serialport and ida-no-fileio).
+
+    *whole_text* builds the variant for scanning a whole '\\n'-separated file at
+    once: '^' matches at every line start and '\\s' cannot cross a newline, so
+    it matches exactly on the lines where the per-line alternation would.
+    """
+    imports = "|".join(f"(?:{pat})" for pat, _ in import_rules.values())
+    calls = "|".join(f"(?:{pat})" for pat, _ in IDA_FORBIDDEN_CALLS.values())
+    pattern = f"(?i:{imports})|{calls}"
+    if whole_text:
+        return re.compile(pattern.replace(r"\s", r"[^\S\n]"), re.MULTILINE)
+    return re.compile(pattern)
+
+
+IDA_LINE_PREFILTER_VB = _build_ida_line_prefilter(IDA_FORBIDDEN_IMPORTS_VB)
+IDA_LINE_PREFILTER_CS = _build_ida_line_prefilter(IDA_FORBIDDEN_IMPORTS_CS)
+IDA_TEXT_PREFILTER_VB = _build_ida_line_prefilter(IDA_FORBIDDEN_IMPORTS_VB, whole_text=True)
+IDA_TEXT_PREFILTER_CS = _build_ida_line_prefilter(IDA_FORBIDDEN_IMPORTS_CS, whole_text=True)
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Line-comment heuristics (no block-comment tracking): reference scans also
+# skip lines opening with /*, the ida_ red-flag scans do not.
+REFERENCE_COMMENT_RE = re.compile(r"\s*(?:'|//|/\*)")
+RED_FLAG_COMMENT_RE = re.compile(r"\s*(?:'|//)")
+
+
+class SourceCache:
+    """Per-run source cache: each file is read and decoded at most once.
+
+    Read failures are cached too, so every caller sees the same OSError.
+    Files listed with size 0 in *sizes* are served as empty text unopened.
+    """
+
+    def __init__(self, sizes: dict[Path, int] | None = None) -> None:
+        self._sizes = sizes if sizes is not None else {}
+        self._texts: dict[Path, str | OSError] = {}
+        self._lines: dict[Path, list[str]] = {}
+        self._significant: dict[tuple[Path, re.Pattern], list[tuple[int, str]]] = {}
+        self._code_lines: dict[Path, int] = {}
+
+    def text(self, path: Path) -> str:
+        text = self._texts.get(path)
+        if text is None:
+            try:
+                text = "" if self._sizes.get(path) == 0 else read_source_text(path)
+            except OSError as e:
+                text = e
+            self._texts[path] = text
+        if isinstance(text, OSError):
+            raise text
+        return text
+
+    def lines(self, path: Path) -> list[str]:
+        lines = self._lines.get(path)
+        if lines is None:
+            lines = self._lines[path] = self.text(path).splitlines()
+        return lines
+
+    def significant_lines(self, path: Path, comment_re: re.Pattern) -> list[tuple[int, str]]:
+        """Return (line_no, line) for lines that *comment_re* does not match at the start."""
+        key = (path, comment_re)
+        significant = self._significant.get(key)
+        if significant is None:
+            is_comment = comment_re.match
+            significant = self._significant[key] = [
+                (line_no, line)
+                for line_no, line in enumerate(self.lines(path), start=1)
+                if not is_comment(line)
+            ]
+        return significant
+
+    def count_code_lines(self, path: Path) -> int:
+        count = self._code_lines.get(path)
+        if count is None:
+            try:
+                count = count_code_lines_from_text(self.text(path))
+            except OSError:
+                count = 0
+            self._code_lines[path] = count
+        return count
+
+    def count_conditionals(self, path: Path) -> int:
+        return count_domain_conditionals(self.text(path))
+
+
 def get_role(filename: str) -> str | None:
     """Return architectural role string if filename matches a known prefix, else None."""
     name = Path(filename).name.lower()
-    for prefix, role in ROLE_PREFIXES.items():
-        if name.startswith(prefix):
-            return role
-    return None
+    return ROLE_PREFIXES.get(name[:_ROLE_PREFIX_LEN])
 
 
 def get_prefix(filename: str) -> str | None:
     """Return the architectural prefix (e.g. 'ida_') if filename matches, else None."""
-    name = Path(filename).name.lower()
-    for prefix in ROLE_PREFIXES:
-        if name.startswith(prefix):
-            return prefix
-    return None
+    prefix = Path(filename).name.lower()[:_ROLE_PREFIX_LEN]
+    return prefix if prefix in ROLE_PREFIXES else None
 
 
 
@@ -142,10 +252,9 @@ def extract_feature_name(file_path: Path) -> str | None:
             return parts[i + 1]
 
     # Mode 2: Filename-based (flat layout fallback)
-    stem = file_path.stem.lower()
-    for prefix in ROLE_PREFIXES:
-        if stem.startswith(prefix):
-            return file_path.stem[len(prefix):]
+    stem = file_path.stem
+    if stem.lower()[:_ROLE_PREFIX_LEN] in ROLE_PREFIXES:
+        return stem[_ROLE_PREFIX_LEN:]
     return None
 
 
@@ -154,54 +263,132 @@ def is_shared_resource(file_path: Path) -> bool:
     Shared resources are not features and are excluded from cross-feature checks.
     See A2.5.2: Shared Domain Utilities.
     """
-    name = file_path.name.lower()
-    return any(name.startswith(prefix) for prefix in SHARED_RESOURCE_PREFIXES)
+    return file_path.name.lower().startswith(_SHARED_RESOURCE_PREFIX_TUPLE)
+
+
+@dataclass(frozen=True)
+class FileMeta:
+    """Name-derived facts about one source file, computed once per run."""
+
+    path: Path
+    name_lower: str
+    role: str | None
+    prefix: str | None
+    class_name: str
+    feature: str | None
+    shared: bool
+
+
+def build_file_meta(path: Path) -> FileMeta:
+    # Same rules as get_role/get_prefix/is_shared_resource, on one lowercased name
+    name_lower = path.name.lower()
+    head = name_lower[:_ROLE_PREFIX_LEN]
+    role = ROLE_PREFIXES.get(head)
+    return FileMeta(
+        path=path,
+        name_lower=name_lower,
+        role=role,
+        prefix=head if role is not None else None,
+        class_name=extract_class_name(path),
+        feature=extract_feature_name(path),
+        shared=name_lower.startswith(_SHARED_RESOURCE_PREFIX_TUPLE),
+    )
 
 
 # ---------------------------------------------------------------------------
 # Build reference maps for dependency direction checking
 # ---------------------------------------------------------------------------
 
-def build_class_map(files: list[Path]) -> dict[str, list[Path]]:
+def build_class_map(metas: list[FileMeta]) -> dict[str, list[tuple[str, Path]]]:
     """Build mapping: role -> list of (class_name, file_path) for all recognized files."""
     role_map: dict[str, list[tuple[str, Path]]] = {"idea": [], "praxis": [], "poiesis": []}
-    for f in files:
-        role = get_role(f.name)
-        if role and role in role_map:
-            role_map[role].append((extract_class_name(f), f))
+    for meta in metas:
+        if meta.role in role_map:
+            role_map[meta.role].append((meta.class_name, meta.path))
     return role_map
 
 
+WORD_TOKEN_RE = re.compile(r"\w+")
+
+# (identifier names, fused pattern for other names or None, per-name entries)
+# Optional rather than '| None': the alias is evaluated at runtime (Python 3.9).
+ReferenceMatcher = tuple[frozenset[str], Optional[re.Pattern], list[tuple[Optional[re.Pattern], str, str]]]
+
+
+@lru_cache(maxsize=None)
+def build_reference_matcher(names: tuple[tuple[str, str], ...]) -> ReferenceMatcher:
+    """Prepare a multi-name \\bname\\b matcher for (class_name, label) pairs.
+
+    An identifier name matches exactly when it equals a whole \\w+ token of
+    the line, so those are found with one tokenize + set intersection per
+    line, linear in line length however many names there are. Names with
+    other characters (e.g. 'ida_Motor.Designer') keep a regex, fused into
+    one alternation so they too cost a single search per line.
+    """
+    entries = []
+    other_names = []
+    for name, label in names:
+        if WORD_TOKEN_RE.fullmatch(name):
+            entries.append((None, name, label))
+        else:
+            entries.append((re.compile(r"\b" + re.escape(name) + r"\b"), name, label))
+            other_names.append(re.escape(name))
+    word_names = frozenset(name for pattern, name, _ in entries if pattern is None)
+    other_re = re.compile(r"\b(?:" + "|".join(other_names) + r")\b") if other_names else None
+    return word_names, other_re, entries
+
+
+def iter_references(line: str, matcher: ReferenceMatcher) -> Iterator[tuple[str, str]]:
+    """Yield (class_name, label) for every name referenced on *line*, in matcher order."""
+    word_names, other_re, entries = matcher
+    hits = word_names.intersection(WORD_TOKEN_RE.findall(line))
+    if not hits and (other_re is None or not other_re.search(line)):
+        return
+    for pattern, name, label in entries:
+        if name in hits if pattern is None else pattern.search(line):
+            yield name, label
+
+
 # ---------------------------------------------------------------------------
 # Stage 1: Idea layer verification (existing)
 # ---------------------------------------------------------------------------
 
-def verify_idea_file(file_path: Path, findings: list) -> None:
+def verify_idea_file(file_path: Path, sources: SourceCache, findings: list) -> None:
     """Check ida_ files for forbidden imports and API calls."""
     ext = file_path.suffix.lower()
-    import_rules = IDA_FORBIDDEN_IMPORTS_VB if ext == ".vb" else IDA_FORBIDDEN_IMPORTS_CS
+    if ext == ".vb":
+        import_rules = IDA_IMPORT_RULES_VB
+        line_prefilter, text_prefilter = IDA_LINE_PREFILTER_VB, IDA_TEXT_PREFILTER_VB
+    else:
+        import_rules = IDA_IMPORT_RULES_CS
+        line_prefilter, text_prefilter = IDA_LINE_PREFILTER_CS, IDA_TEXT_PREFILTER_CS
 
     try:
-        lines = file_path.read_text(encoding="utf-8", errors="replace").splitlines()
+        text = sources.text(file_path)
+        lines = sources.lines(file_path)
     except OSError as e:
         add_finding(findings, "error", file_path, 0, "file-read-error", str(e))
         return
 
-    compiled_imports = {rid: re.compile(pat, re.IGNORECASE) for rid, (pat, _) in import_rules.items()}
-    compiled_calls   = {rid: re.compile(pat) for rid, (pat, _) in IDA_FORBIDDEN_CALLS.items()}
+    # Find candidate lines in one pass over the whole text when its only line
+    # breaks are '\n'; otherwise line numbers must follow splitlines().
+    if OTHER_LINE_BREAK_RE.search(text):
+        candidates = [n for n, line in enumerate(lines, start=1) if line_prefilter.search(line)]
+    else:
+        candidates = iter_match_line_numbers(text_prefilter, text)
+
+    for line_no in candidates:
+        line = lines[line_no - 1]
 
-    for line_no, line in enumerate(lines, start=1):
         # Check forbidden imports
-        for rule_id, regex in compiled_imports.items():
+        for rule_id, regex, msg in import_rules:
             if regex.search(line):
-                _, msg = import_rules[rule_id]
                 add_finding(findings, "error", file_path, line_no, rule_id,
                             f"Forbidden in ida_: {msg}")
 
         # Check forbidden API calls
-        for rule_id, regex in compiled_calls.items():
+        for rule_id, regex, msg in IDA_CALL_RULES:
             if regex.search(line):
-                _, msg = IDA_FORBIDDEN_CALLS[rule_id]
                 add_finding(findings, "error", file_path, line_no, rule_id,
                             f"Forbidden in ida_: {msg}")
 
@@ -210,121 +397,126 @@ def verify_idea_file(file_path: Path, findings: list) -> None:
 # Stage 2: Reverse dependency checks (A2.3.2, A2.6.2, A2.6.3)
 # ---------------------------------------------------------------------------
 
-def verify_reverse_dependencies(file_path: Path, role: str, role_map: dict,
-                                findings: list) -> None:
-    """Check that prx_ does not reference ida_, and poi_ does not reference ida_/prx_."""
-    if role not in ("praxis", "poiesis"):
-        return
-
-    # Determine which roles are forbidden to reference
-    if role == "praxis":
-        forbidden_roles = ["idea"]
-    else:  # poiesis
-        forbidden_roles = ["idea", "praxis"]
+def build_reverse_dependency_matchers(role_map: dict) -> dict[str, ReferenceMatcher | None]:
+    """Build one forbidden-name matcher per referencing role, shared by all its files.
 
-    # Build list of forbidden class names
-    forbidden_names: list[tuple[str, str]] = []  # (class_name, role_label)
-    for frole in forbidden_roles:
-        for class_name, _ in role_map.get(frole, []):
-            forbidden_names.append((class_name, frole))
+    prx_ files may not reference ida_ classes; poi_ files may not reference
+    ida_ or prx_ classes. A role with nothing forbidden maps to None.
+    """
+    matchers: dict[str, ReferenceMatcher | None] = {}
+    for role, forbidden_roles in (("praxis", ("idea",)), ("poiesis", ("idea", "praxis"))):
+        forbidden_names = tuple(
+            (class_name, frole)
+            for frole in forbidden_roles
+            for class_name, _ in role_map.get(frole, [])
+        )
+        matchers[role] = build_reference_matcher(forbidden_names) if forbidden_names else None
+    return matchers
+
+
+def verify_reverse_dependencies(meta: FileMeta, matchers: dict[str, ReferenceMatcher | None],
+                                sources: SourceCache, findings: list) -> None:
+    """Check that prx_ does not reference ida_, and poi_ does not reference ida_/prx_.
+
+    *matchers* comes from build_reverse_dependency_matchers().
+    """
+    file_path = meta.path
+    matcher = matchers.get(meta.role)
+    if matcher is None:
+        return
 
-    if not forbidden_names:
+    # Skip the file's own class (avoid self-matching in edge cases); filtering
+    # after the match keeps one matcher per role instead of one per file
+    own_name = meta.class_name
+    if not any(entry[1] != own_name for entry in matcher[2]):
         return
 
     try:
-        lines = file_path.read_text(encoding="utf-8", errors="replace").splitlines()
+        text = sources.text(file_path)
     except OSError as e:
         add_finding(findings, "error", file_path, 0, "file-read-error", str(e))
         return
 
-    # Build regex patterns for each forbidden class name
     # Match word-boundary class name references (not inside comments ideally,
     # but comment-aware parsing is out of scope for this gate)
-    forbidden_patterns: list[tuple[re.Pattern, str, str]] = []
-    for class_name, role_label in forbidden_names:
-        # Skip if the forbidden class name is a substring of the current file's class name
-        # (avoid self-matching in edge cases)
-        own_name = extract_class_name(file_path)
-        if class_name == own_name:
-            continue
-        pattern = re.compile(r"\b" + re.escape(class_name) + r"\b")
-        forbidden_patterns.append((pattern, class_name, role_label))
-
-    role_prefix = get_prefix(file_path.name)
-    for line_no, line in enumerate(lines, start=1):
-        # Skip comment lines (basic heuristic)
-        stripped = line.strip()
-        if stripped.startswith("'") or stripped.startswith("//") or stripped.startswith("/*"):
-            continue
+    # A name no line references cannot appear in the whole text either
+    if all(class_name == own_name for class_name, _ in iter_references(text, matcher)):
+        return
+    lines = sources.significant_lines(file_path, REFERENCE_COMMENT_RE)
 
-        for pattern, class_name, role_label in forbidden_patterns:
-            if pattern.search(line):
-                rule_id = f"{role_prefix}no-{role_label}-ref"
-                add_finding(findings, "error", file_path, line_no, rule_id,
-                            f"Reverse dependency: {role_prefix} references {class_name} ({role_label} layer)")
+    role_prefix = meta.prefix
+    # Comment lines are already skipped (basic heuristic)
+    for line_no, line in lines:
+        for class_name, role_label in iter_references(line, matcher):
+            if class_name == own_name:
+                continue
+            rule_id = f"{role_prefix}no-{role_label}-ref"
+            add_finding(findings, "error", file_path, line_no, rule_id,
+                        f"Reverse dependency: {role_prefix} references {class_name} ({role_label} layer)")
 
 
 # ---------------------------------------------------------------------------
 # Stage 3: Cross-feature layer reference check (A2.6.6)
 # ---------------------------------------------------------------------------
 
-def verify_cross_feature_references(file_path: Path, role: str, all_layer_files: list[Path],
-                                    findings: list) -> None:
+def collect_feature_classes(layer_metas: list[FileMeta]) -> list[tuple[str, str, str]]:
+    """Return (class_name, feature_name, feature_key) for every feature-owned layer file.
+
+    Shared resources are accessible from any layer per dependency rules, and
+    files without a feature (e.g. bootstrap core) cannot be cross-referenced.
+    *feature_key* is the lowercased feature name used for same-feature checks.
+    """
+    return [
+        (meta.class_name, meta.feature, meta.feature.lower())
+        for meta in layer_metas
+        # Only flag ida_/prx_/poi_ cross-references
+        if not meta.shared and meta.feature is not None and meta.role
+    ]
+
+
+def verify_cross_feature_references(meta: FileMeta, feature_classes: list[tuple[str, str, str]],
+                                    sources: SourceCache, findings: list) -> None:
     """Check that feature layer files do not reference layer files from other features.
 
     Shared resources (cfg_, db_, stm_, svc_, mdw_, hal_, bsp_) are excluded from
     this check per A2.5.2 (Shared Domain Utilities). They belong to the capability
     plane or data plane, not to any specific feature.
+    *feature_classes* comes from collect_feature_classes() over all layer files.
     """
+    file_path = meta.path
     # Skip shared resource files -- they are not features
-    if is_shared_resource(file_path):
+    if meta.shared:
         return
 
-    own_feature = extract_feature_name(file_path)
-    if own_feature is None:
+    if meta.feature is None:
         return
 
-    # Collect layer class names from OTHER features (excluding shared resources)
-    cross_feature_names: list[tuple[str, str]] = []  # (class_name, feature_name)
-    for other_file in all_layer_files:
-        # Skip shared resources -- they are accessible from any layer per dependency rules
-        if is_shared_resource(other_file):
-            continue
-        other_feature = extract_feature_name(other_file)
-        if other_feature is None:
-            continue
-        # Same feature is allowed
-        if other_feature.lower() == own_feature.lower():
-            continue
-        other_class = extract_class_name(other_file)
-        # Only flag ida_/prx_/poi_ cross-references
-        other_role = get_role(other_file.name)
-        if other_role:
-            cross_feature_names.append((other_class, other_feature))
+    # Layer class names from OTHER features (same feature is allowed)
+    own_key = meta.feature.lower()
+    cross_feature_names = tuple(
+        (class_name, feature_name)
+        for class_name, feature_name, feature_key in feature_classes
+        if feature_key != own_key
+    )
 
     if not cross_feature_names:
         return
 
     try:
-        lines = file_path.read_text(encoding="utf-8", errors="replace").splitlines()
+        text = sources.text(file_path)
     except OSError as e:
         add_finding(findings, "error", file_path, 0, "file-read-error", str(e))
         return
 
-    cross_patterns: list[tuple[re.Pattern, str, str]] = []
-    for class_name, feature_name in cross_feature_names:
-        pattern = re.compile(r"\b" + re.escape(class_name) + r"\b")
-        cross_patterns.append((pattern, class_name, feature_name))
-
-    for line_no, line in enumerate(lines, start=1):
-        stripped = line.strip()
-        if stripped.startswith("'") or stripped.startswith("//") or stripped.startswith("/*"):
-            continue
+    matcher = build_reference_matcher(cross_feature_names)
+    if next(iter_references(text, matcher), None) is None:
+        return
+    lines = sources.significant_lines(file_path, REFERENCE_COMMENT_RE)
 
-        for pattern, class_name, feature_name in cross_patterns:
-            if pattern.search(line):
-                add_finding(findings, "error", file_path, line_no, "cross-feature-layer-ref",
-                            f"Cross-feature reference: references {class_name} from feature '{feature_name}' (use stm_ data plane)")
+    for line_no, line in lines:
+        for class_name, feature_name in iter_references(line, matcher):
+            add_finding(findings, "error", file_path, line_no, "cross-feature-layer-ref",
+                        f"Cross-feature reference: references {class_name} from feature '{feature_name}' (use stm_ data plane)")
 
 
 # ---------------------------------------------------------------------------
@@ -361,7 +553,7 @@ VB_MUTABLE_FIELD_RE = re.compile(
 
 
 
-def verify_red_flags_oop(ida_files: list[Path], findings: list) -> None:
+def verify_red_flags_oop(ida_files: list[Path], sources: SourceCache, findings: list) -> None:
     """OOP-specific Red Flag checks (A2.8.2): feature resource access and mutable fields.
 
     The three universal checks (Empty Idea, Fat Poiesis, Fat Praxis) are
@@ -371,13 +563,10 @@ def verify_red_flags_oop(ida_files: list[Path], findings: list) -> None:
     # cfg_core/cfg_Core are allowed (A2.2.2). Other cfg_/db_/stm_ in ida_ = advisory.
     for f in ida_files:
         try:
-            lines = f.read_text(encoding="utf-8", errors="replace").splitlines()
+            lines = sources.significant_lines(f, RED_FLAG_COMMENT_RE)
         except OSError:
             continue
-        for line_no, line in enumerate(lines, start=1):
-            stripped = line.strip()
-            if stripped.startswith("'") or stripped.startswith("//"):
-                continue
+        for line_no, line in lines:
             if FEATURE_RESOURCE_RE.search(line):
                 add_finding(findings, "warning", f, line_no, "red-flag-ida-feature-resource",
                             "Possible self-containment violation: ida_ references a feature resource "
@@ -391,13 +580,10 @@ def verify_red_flags_oop(ida_files: list[Path], findings: list) -> None:
         ext = f.suffix.lower()
         mutable_re = CS_MUTABLE_FIELD_RE if ext == ".cs" else VB_MUTABLE_FIELD_RE
         try:
-            lines = f.read_text(encoding="utf-8", errors="replace").splitlines()
+            lines = sources.significant_lines(f, RED_FLAG_COMMENT_RE)
         except OSError:
             continue
-        for line_no, line in enumerate(lines, start=1):
-            stripped = line.strip()
-            if stripped.startswith("'") or stripped.startswith("//"):
-                continue
+        for line_no, line in lines:
             if mutable_re.search(line):
                 add_finding(findings, "warning", f, line_no, "red-flag-ida-mutable-field",
                             "Possible purity violation: ida_ may declare a mutable instance field. "
@@ -406,11 +592,149 @@ def verify_red_flags_oop(ida_files: list[Path], findings: list) -> None:
 
 
 # ---------------------------------------------------------------------------
-# Main runner
+# Per-file runner for Stages 1-3 (serial or process pool)
 # ---------------------------------------------------------------------------
 
-def run(root: Path, extensions: set[str], report_path: Path | None) -> int:
+# Run-wide inputs (role_map, feature_classes, sizes), installed once per worker by
+# the pool initializer so each task carries only one file path.
+_LAYER_SCAN_SHARED: dict[str, object] = {}
+
+
+def init_layer_scan_worker(shared: dict[str, object]) -> None:
+    _LAYER_SCAN_SHARED.clear()
+    _LAYER_SCAN_SHARED.update(shared)
+    _LAYER_SCAN_SHARED["reverse_matchers"] = build_reverse_dependency_matchers(shared["role_map"])
+
+
+def verify_layer_file(meta: FileMeta, sources: SourceCache | None = None) -> list[dict]:
+    """Run the idea, reverse-dependency and cross-feature checks for one layer file."""
+    if sources is None:
+        sources = SourceCache(_LAYER_SCAN_SHARED.get("sizes"))
     findings: list[dict] = []
+    if meta.role == "idea":
+        verify_idea_file(meta.path, sources, findings)
+    elif meta.role in ("praxis", "poiesis"):
+        verify_reverse_dependencies(meta, _LAYER_SCAN_SHARED["reverse_matchers"], sources, findings)
+    verify_cross_feature_references(meta, _LAYER_SCAN_SHARED["feature_classes"], sources, findings)
+    # Return one presorted run (every finding here shares meta.path) so the
+    # final (file, line, rule) sort merges runs instead of sorting from scratch
+    findings.sort(key=lambda f: (f["line"], f["rule"]))
+    return findings
+
+
+def verify_layer_files(layer_metas: list[FileMeta], shared: dict[str, object],
+                       sources: SourceCache, jobs: int) -> list[list[dict]]:
+    """Run verify_layer_file over *layer_metas*, fanning out to *jobs* processes for large runs.
+
+    The serial path shares the caller's *sources*, so later stages reuse what
+    it read; pool workers read their files themselves.
+    """
+    if jobs > 1 and len(layer_metas) >= PARALLEL_SCAN_MIN_FILES:
+        with ProcessPoolExecutor(
+            max_workers=jobs,
+            initializer=init_layer_scan_worker,
+            initargs=(shared,),
+        ) as executor:
+            chunksize = max(1, len(layer_metas) // (4 * jobs))
+            return list(executor.map(verify_layer_file, layer_metas, chunksize=chunksize))
+    init_layer_scan_worker(shared)
+    return [verify_layer_file(meta, sources) for meta in layer_metas]
+
+
+# ---------------------------------------------------------------------------
+# Per-file result cache (-UseCache)
+# ---------------------------------------------------------------------------
+
+def compute_rules_version() -> str:
+    """Hash this script and the shared helpers so rule changes invalidate the check cache."""
+    digest = hashlib.blake2b(digest_size=16)
+    script_dir = Path(__file__).resolve().parent
+    for name in (Path(__file__).name, "comsect1_gate_helpers.py"):
+        digest.update((script_dir / name).read_bytes())
+    return digest.hexdigest()
+
+
+def compute_check_context(shared: dict[str, object]) -> str:
+    """Hash the run-wide class/feature name lists Stages 2-3 match against.
+
+    A file's cached findings depend only on its own content and these names,
+    so adding, removing or renaming any layer file invalidates every entry.
+    """
+    role_names = [(role, name) for role, entries in shared["role_map"].items() for name, _ in entries]
+    payload = json.dumps([role_names, shared["feature_classes"]], ensure_ascii=False)
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def load_check_cache(cache_path: Path, rules_version: str, context: str) -> dict[str, dict[str, object]]:
+    """Load cached per-file findings; a missing, unreadable or stale cache is empty."""
+    try:
+        data = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("rulesVersion") != rules_version or data.get("context") != context:
+        return {}
+    files = data.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def save_check_cache(cache_path: Path, rules_version: str, context: str,
+                     entries: dict[str, dict[str, object]]) -> None:
+    """Atomically replace the check cache (last writer wins; entries are re-validated on load)."""
+    tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(
+        json.dumps({"rulesVersion": rules_version, "context": context, "files": entries}, ensure_ascii=False),
+        encoding="utf-8",
+    )
+    os.replace(tmp_path, cache_path)
+
+
+def verify_layer_files_cached(layer_metas: list[FileMeta], shared: dict[str, object],
+                              sources: SourceCache, jobs: int,
+                              cache: dict[str, dict[str, object]]) -> list[list[dict]]:
+    """verify_layer_files, reusing *cache* entries whose ``(mtime_ns, size)`` still match.
+
+    Cache misses are checked (in parallel when large enough) and stored back
+    into *cache*; entries for files no longer present are dropped.
+    """
+    results: dict[Path, list[dict]] = {}
+    pending: list[FileMeta] = []
+    stats: dict[Path, os.stat_result] = {}
+    for meta in layer_metas:
+        try:
+            st = os.stat(meta.path)
+        except OSError:
+            pending.append(meta)
+            continue
+        stats[meta.path] = st
+        entry = cache.get(str(meta.path))
+        if entry and entry.get("mtimeNs") == st.st_mtime_ns and entry.get("size") == st.st_size:
+            results[meta.path] = entry["findings"]
+        else:
+            pending.append(meta)
+
+    for meta, file_findings in zip(pending, verify_layer_files(pending, shared, sources, jobs)):
+        results[meta.path] = file_findings
+        st = stats.get(meta.path)
+        if st is not None:
+            cache[str(meta.path)] = {"mtimeNs": st.st_mtime_ns, "size": st.st_size, "findings": file_findings}
+
+    live = {str(meta.path) for meta in layer_metas}
+    for key in [key for key in cache if key not in live]:
+        del cache[key]
+    return [results[meta.path] for meta in layer_metas]
+
+
+# ---------------------------------------------------------------------------
+# Main runner
+# ---------------------------------------------------------------------------
+
+def run(root: Path, extensions: set[str], report_path: Path | None, jobs: int = 1,
+        use_cache: bool = False) -> int:
+    # Duplicates (same file+line+rule) are dropped as they are added
+    findings = FindingTable(unique=True)
+    file_sizes: dict[Path, int] = {}
+    sources = SourceCache(file_sizes)
+    build_reference_matcher.cache_clear()
 
     root_boundary_issue = validate_comsect1_root_boundary(root)
     if root_boundary_issue:
@@ -418,26 +742,26 @@ def run(root: Path, extensions: set[str], report_path: Path | None) -> int:
 
     verify_folder_structure(root, findings)
 
-    files = collect_source_files(root, extensions)
+    files = collect_source_files(root, extensions, file_sizes)
     # Exclude deps/ — external dependency code is verified by its own gate.
     # The consumer project gate checks only project-owned code (project/ and infra/).
     # deps/ is a Dependency Repository (§7.3), not project-owned code.
     _deps_dir = root / "deps"
     if _deps_dir.exists():
         files = [f for f in files if not f.is_relative_to(_deps_dir)]
-    role_map = build_class_map(files)
+    # Collect all layer files (with their name-derived facts) for cross-feature check
+    layer_metas = [meta for meta in map(build_file_meta, files) if meta.role is not None]
+    role_map = build_class_map(layer_metas)
 
-    # Collect all layer files for cross-feature check
-    all_layer_files = [f for f in files if get_role(f.name) is not None]
-
-    ida_files = [f for _, fl in role_map.items() for _, f in fl if get_role(f.name) == "idea"]
-    prx_files = [f for _, fl in role_map.items() for _, f in fl if get_role(f.name) == "praxis"]
-    poi_files = [f for _, fl in role_map.items() for _, f in fl if get_role(f.name) == "poiesis"]
+    ida_files = [f for _, f in role_map["idea"]]
+    prx_files = [f for _, f in role_map["praxis"]]
+    poi_files = [f for _, f in role_map["poiesis"]]
 
     total_checked = len(ida_files) + len(prx_files) + len(poi_files)
 
     if total_checked == 0:
         if findings:
+            findings = findings.records()
             errors = [f for f in findings if f["severity"] == "error"]
             print(f"\n{'='*60}")
             print(f"  comsect1 OOP Gate - FAILED  ({len(errors)} error(s), 0 warning(s))")
@@ -456,47 +780,56 @@ def run(root: Path, extensions: set[str], report_path: Path | None) -> int:
         return 0
 
     # Stage 1: Idea layer - forbidden imports and API calls
-    for f in ida_files:
-        verify_idea_file(f, findings)
-
     # Stage 2: Reverse dependency checks (prx_ -> ida_, poi_ -> ida_/prx_)
-    for f in prx_files:
-        verify_reverse_dependencies(f, "praxis", role_map, findings)
-    for f in poi_files:
-        verify_reverse_dependencies(f, "poiesis", role_map, findings)
-
     # Stage 3: Cross-feature layer references
-    for f in all_layer_files:
-        role = get_role(f.name)
-        if role:
-            verify_cross_feature_references(f, role, all_layer_files, findings)
+    # All three are per-file, so they run together file by file.
+    shared = {
+        "role_map": role_map,
+        "feature_classes": collect_feature_classes(layer_metas),
+        "sizes": file_sizes,
+    }
+    if use_cache:
+        cache_path = root / CHECK_CACHE_NAME
+        rules_version = compute_rules_version()
+        context = compute_check_context(shared)
+        check_cache = load_check_cache(cache_path, rules_version, context)
+        layer_results = verify_layer_files_cached(layer_metas, shared, sources, jobs, check_cache)
+        try:
+            save_check_cache(cache_path, rules_version, context, check_cache)
+        except OSError as exc:
+            print(f"WARNING: could not write check cache {cache_path}: {exc}", file=sys.stderr)
+    else:
+        layer_results = verify_layer_files(layer_metas, shared, sources, jobs)
+    for file_findings in layer_results:
+        for f in file_findings:
+            findings.add(f["severity"], f["file"], f["line"], f["rule"], f["message"])
+
+    meta_by_path = {meta.path: meta for meta in layer_metas}
+
+    def feature_of(path: Path) -> str | None:
+        return meta_by_path[path].feature
 
     # Stage 4: Layer Balance Invariant (v1.0.1, error severity)
     verify_layer_balance(
         ida_files, poi_files, findings,
-        extract_feature=extract_feature_name, count_lines=count_code_lines,
+        extract_feature=feature_of, count_lines=sources.count_code_lines,
+        count_conditionals=sources.count_conditionals,
     )
 
     # Stage 5: Red Flag heuristics (advisory)
     verify_red_flags_common(
         ida_files, prx_files, poi_files, findings,
-        count_lines=count_code_lines,
-        extract_feature=extract_feature_name,
+        count_lines=sources.count_code_lines,
+        extract_feature=feature_of,
+        count_conditionals=sources.count_conditionals,
+        read_text=sources.text,
     )
-    verify_red_flags_oop(ida_files, findings)
+    verify_red_flags_oop(ida_files, sources, findings)
 
-    # Sort for deterministic output
-    findings.sort(key=lambda x: (x["file"], x["line"], x["rule"]))
-
-    # Deduplicate (same file+line+rule)
-    seen = set()
-    unique_findings = []
-    for f in findings:
-        key = (f["file"], f["line"], f["rule"])
-        if key not in seen:
-            seen.add(key)
-            unique_findings.append(f)
-    findings = unique_findings
+    # Sort for deterministic output. Stages 1-3 arrive as per-file sorted
+    # runs in path order, which timsort merges in near-linear time; only the
+    # Stage 4-5 findings appended after them need real sorting work.
+    findings = findings.records(sort=True)
 
     # Console output
     errors = [f for f in findings if f["severity"] == "error"]
@@ -527,6 +860,8 @@ def run(root: Path, extensions: set[str], report_path: Path | None) -> int:
 
     # JSON report
     if report_path:
+        from datetime import datetime, timezone
+
         report = {
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "root": str(root),
@@ -539,7 +874,9 @@ def run(root: Path, extensions: set[str], report_path: Path | None) -> int:
             "findings": findings,
         }
         report_path.parent.mkdir(parents=True, exist_ok=True)
-        report_path.write_text(json.dumps(report, indent=2, ensure_ascii=False), encoding="utf-8")
+        # Stream the encoder's chunks instead of building the whole report string first.
+        with report_path.open("w", encoding="utf-8", buffering=1 << 20) as handle:
+            json.dump(report, handle, indent=2, ensure_ascii=False)
         print(f"  Report written: {report_path}\n")
 
     return 0 if not errors else 2
@@ -556,6 +893,10 @@ def main() -> None:
     parser.add_argument("-Extensions", default=".vb,.cs",
                         help="Comma-separated file extensions (default: .vb,.cs)")
     parser.add_argument("-ReportPath", default=None, help="Path for JSON report output")
+    parser.add_argument("-Jobs", type=int, default=None,
+                        help="Worker processes for per-file checks (default: CPU count; 1 disables)")
+    parser.add_argument("-UseCache", action="store_true",
+                        help=f"Reuse per-file check results from <Root>/{CHECK_CACHE_NAME} for unchanged files")
     args = parser.parse_args()
 
     root = Path(args.Root).resolve()
@@ -567,7 +908,9 @@ def main() -> None:
                   for e in args.Extensions.split(",")}
     report_path = Path(args.ReportPath).resolve() if args.ReportPath else None
 
-    sys.exit(run(root, extensions, report_path))
+    jobs = args.Jobs if args.Jobs is not None else (os.cpu_count() or 1)
+
+    sys.exit(run(root, extensions, report_path, jobs, args.UseCache))
 
 
 if __name__ == "__main__":
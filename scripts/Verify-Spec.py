@@ -4,11 +4,127 @@
 from __future__ import annotations
 
 import argparse
+import mmap
+import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
 
-from comsect1_gate_helpers import resolve_repo_root
+from comsect1_gate_helpers import (
+    OTHER_LINE_BREAK_RE,
+    iter_line_matches,
+    iter_match_line_numbers,
+    resolve_repo_root,
+)
+
+UTF8_BOM = b"\xef\xbb\xbf"
+UTF8_REPLACEMENT_CHAR = "\ufffd".encode("utf-8")
+# H1 forms '# N. ...' (group n set) and '# Appendix X. ...' (group n None)
+# in one match; the two branches start with a digit / 'A', so they never overlap.
+H1_RE = re.compile(r"^#\s*(?:(?P<n>\d+)\.\s+|Appendix\s+[A-Z]\.)")
+# Numbered sections: NN_slug.md
+# Appendices: A<index>_slug.md (e.g., A1_exception_handling.md)
+SPEC_NAME_RE = re.compile(r"^(?:(?P<num>\d{2})|A\d+)_[a-z0-9_]+\.md$")
+# MULTILINE with [^\S\n] so a whole-text scan matches exactly the lines a
+# per-line scan would; it works unchanged on a single line too.
+NUMBERED_HEADING_RE = re.compile(r"^(?P<hash>#{2,6})[^\S\n]+(?P<n>\d+)\.(?P<rest>.*)$", re.MULTILINE)
+
+# SSOT term consistency: detect use of inf_ as an actual file-role prefix
+# in code examples or file references (not in rules that forbid it).
+# Matches inf_<word>.<ext> used as a filename; has_inf_file_usage() excludes
+# inline code backticks where the spec is explaining "do not use inf_". The
+# backtick test stays out of the pattern: a leading lookbehind stops re from
+# using its fast literal-prefix search for "inf_".
+INF_FILE_USAGE_RE = re.compile(r"inf_\w+\.(?:c|h|py|cs|vb)\b")
+
+# Code fence opener/closer: a line whose first non-blank text is ```; MULTILINE
+# with [^\S\n] so a whole-text scan finds exactly the lines a per-line
+# line.lstrip().startswith("```") test would.
+FENCE_LINE_RE = re.compile(r"^[^\S\n]*```", re.MULTILINE)
+
+# Cross-reference validation: heading registry from all spec files
+SECTION_HEADING_RE = re.compile(
+    r"^#{1,6}\s+(?:(?P<major>\d+)\.(?P<minor>\d+(?:\.\d+)*)?)\s",
+)
+# Also match "Appendix X." headings
+APPENDIX_HEADING_RE = re.compile(
+    r"^#{1,6}\s+Appendix\s+(?P<letter>[A-Z])(?P<minor>\d+)?\.?\s",
+)
+# Cross-references: §X.Y, Section X.Y, §X
+XREF_RE = re.compile(r"(?:§|Section\s+)(?P<ref>(?P<major>\d+)(?P<minor>(?:\.\d+)+)?)")
+
+# SSOT restatement detection: warn when a normative rule is fully
+# restated outside its designated Single Source of Truth file.
+# Each entry: rule-id -> (ssot filename, compiled regex pattern)
+# The pattern matches FULL restatements, not brief "see §X" references.
+SSOT_RULES: list[tuple[str, str, re.Pattern[str]]] = [
+    (
+        "dep-direction",
+        "05_dependency_rules.md",
+        re.compile(
+            r"IDA\s*->\s*\{\s*own\s+PRX\s*,\s*own\s+POI\s*\}",
+        ),
+    ),
+    (
+        "ida-self-contain",
+        "04_layer_roles.md",
+        re.compile(
+            r"[Ii]dea\s+(?:must\s+not|does\s+not|cannot)\s+(?:include|access|depend\s+on|import)"
+            r".*(?:mdw_|svc_|hal_|bsp_)",
+        ),
+    ),
+    (
+        "feature-isolation",
+        "05_dependency_rules.md",
+        re.compile(
+            r"[Ff]eature\s*(?:<->|↔|\sto\s)\s*[Ff]eature.*stm_\s*only",
+        ),
+    ),
+    (
+        "hal-bsp-direction",
+        "05_dependency_rules.md",
+        re.compile(
+            r"(?:^|\s)HAL\s*->\s*BSP(?:\s|$)",
+        ),
+    ),
+    (
+        "cross-feature-prohibition",
+        "05_dependency_rules.md",
+        re.compile(
+            r"(?:prx_|poi_).*must\s+not\s+include\s+(?:another|other)\s+feature",
+            re.IGNORECASE,
+        ),
+    ),
+]
+
+# Files that are exempt from restatement warnings:
+# - 09_code_examples.md: illustrative, non-normative
+# - 12_version_history.md: historical record (low priority, warn anyway
+#   for full restatements but we can suppress later if needed)
+SSOT_EXEMPT_FILES: set[str] = {"09_code_examples.md"}
+
+# Rules whose signatures commonly appear inside code-block diagrams
+# and should still be checked there.
+SSOT_CHECK_IN_CODE_BLOCKS: set[str] = {
+    "dep-direction",
+    "hal-bsp-direction",
+    "feature-isolation",
+}
+
+# A literal every match of the rule's pattern must contain; lines without it
+# skip the regex (and its '.*' backtracking) entirely.
+SSOT_RULE_LITERALS: dict[str, str] = {
+    "dep-direction": "->",
+    "ida-self-contain": "dea",
+    "feature-isolation": "stm_",
+    "hal-bsp-direction": "HAL",
+    "cross-feature-prohibition": "_",
+}
+
+# Below this many spec files, worker start-up costs more than it saves.
+PARALLEL_SCAN_MIN_FILES = 32
 
 
 def add_issue(issues: list[str], message: str) -> None:
@@ -16,7 +132,17 @@ def add_issue(issues: list[str], message: str) -> None:
 
 
 def has_utf8_bom(path: Path) -> bool:
-    return path.read_bytes().startswith(b"\xef\xbb\xbf")
+    with path.open("rb") as handle:
+        return handle.read(3) == UTF8_BOM
+
+
+def quick_artifact_scan(path: Path) -> tuple[bool, bool]:
+    """Return (has U+FFFD, has '??') for *path*, searching its mapped bytes without decoding."""
+    with path.open("rb") as handle:
+        if os.fstat(handle.fileno()).st_size == 0:
+            return False, False  # mmap rejects empty files
+        with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return mapped.find(UTF8_REPLACEMENT_CHAR) != -1, mapped.find(b"??") != -1
 
 
 def get_file_text_utf8(path: Path) -> str:
@@ -54,13 +180,216 @@ def iter_repo_text_files(repo_root: Path) -> list[Path]:
     return sorted(files)
 
 
+@dataclass
+class SpecFileScan:
+    """Everything one spec file contributes to the report, gathered in a single read.
+
+    Cross-references are returned unresolved: they can only be checked once
+    every file's headings are in *sections*.
+    """
+
+    structure_issues: list[str] = field(default_factory=list)
+    inf_issues: list[str] = field(default_factory=list)
+    sections: set[str] = field(default_factory=set)
+    # (line_no, ref, major) with major None when ref has no minor part
+    xrefs: list[tuple[int, str, str | None]] = field(default_factory=list)
+    ssot_warnings: list[str] = field(default_factory=list)
+
+
+def check_spec_structure(
+    name: str, text: str, lines: list[str], file_number: int | None, issues: list[str]
+) -> None:
+    """Check encoding, H1 numbering and numbered sub-headings of a validly named spec file."""
+    is_numbered_file = file_number is not None
+
+    if "\ufffd" in text:
+        add_issue(issues, f"Encoding replacement character (U+FFFD) found: specs/{name}")
+
+    first_non_empty = next((line for line in lines if line.strip()), None)
+    if first_non_empty is None:
+        add_issue(issues, f"Empty file: specs/{name}")
+        return
+
+    h1_is_numeric = False
+    h1_number = None
+
+    h1_match = H1_RE.match(first_non_empty)
+    if h1_match is None:
+        add_issue(
+            issues,
+            f"H1 does not start with a section number (expected '# N. ...' or 'Appendix X. ...'): specs/{name}",
+        )
+    elif h1_match.group("n") is not None:
+        h1_number = int(h1_match.group("n"))
+        h1_is_numeric = True
+        if is_numbered_file and file_number is not None and h1_number != file_number:
+            add_issue(
+                issues,
+                f"H1 section number mismatch: specs/{name} (H1={h1_number}, filename={file_number:02d})",
+            )
+
+    if h1_is_numeric and is_numbered_file and h1_number is not None:
+        numbered_headings: list[tuple[int, str, int]]
+        if OTHER_LINE_BREAK_RE.search(text):
+            numbered_headings = [
+                (idx, lines[idx - 1], int(heading_match.group("n")))
+                for idx, heading_match in enumerate(map(NUMBERED_HEADING_RE.match, lines), start=1)
+                if heading_match
+            ]
+        else:
+            numbered_headings = [
+                (idx, heading_match.group(0), int(heading_match.group("n")))
+                for idx, heading_match in iter_line_matches(NUMBERED_HEADING_RE, text)
+            ]
+
+        if numbered_headings:
+            distinct_ns = sorted({item[2] for item in numbered_headings})
+            is_prefixed = len(distinct_ns) == 1 and distinct_ns[0] == h1_number
+            is_local = 1 in distinct_ns
+            if not is_prefixed and not is_local:
+                first = numbered_headings[0]
+                add_issue(
+                    issues,
+                    "Numbered headings do not match H1 N and do not start at 1: "
+                    f"specs/{name}:{first[0]} ('{first[1].strip()}')",
+                )
+
+
+def has_inf_file_usage(line: str) -> bool:
+    """Return True if *line* names an inf_ file not directly preceded by a backtick."""
+    m = INF_FILE_USAGE_RE.search(line)
+    while m is not None:
+        start = m.start()
+        if start == 0 or line[start - 1] != "`":
+            return True
+        # Retry from the next position: a later inf_ may overlap this match
+        m = INF_FILE_USAGE_RE.search(line, start + 1)
+    return False
+
+
+def find_fence_lines(text: str, lines: list[str]) -> set[int]:
+    """Return the 1-based numbers of the lines in *text* that open or close a code fence."""
+    if OTHER_LINE_BREAK_RE.search(text):
+        return {line_no for line_no, line in enumerate(lines, start=1) if line.lstrip().startswith("```")}
+    return set(iter_match_line_numbers(FENCE_LINE_RE, text))
+
+
+def scan_spec_lines(name: str, text: str, lines: list[str], scan: SpecFileScan) -> None:
+    """Run the inf_, heading-registry, cross-reference and SSOT checks in one pass over *lines*.
+
+    Code-fence state is tracked once and shared: inf_ usage ignores fenced,
+    heading and quote lines; SSOT rules outside SSOT_CHECK_IN_CODE_BLOCKS
+    ignore fenced lines; headings and cross-references are read everywhere.
+    """
+    # Rules whose SSOT is this very file never apply to it
+    ssot_rules = [] if name in SSOT_EXEMPT_FILES else [
+        (rule_id, ssot_file, pattern, SSOT_RULE_LITERALS[rule_id])
+        for rule_id, ssot_file, pattern in SSOT_RULES
+        if ssot_file != name
+    ]
+    # Fences are located in one whole-text scan, and the indentation-insensitive
+    # heading/quote tests only run on the rare lines holding an xref or inf_
+    # literal, so ordinary lines are never stripped.
+    fence_lines = find_fence_lines(text, lines)
+    in_code_block = False
+    for line_no, line in enumerate(lines, start=1):
+        if line.startswith("#"):
+            # Both heading patterns are anchored at '#'; indented headings never match
+            collect_heading_sections(line, scan.sections)
+
+        if ("§" in line or "Section" in line) and not line.lstrip().startswith("#"):
+            # Heading lines are definitions, not references. The substring
+            # screen skips the regex on the many lines with neither literal.
+            for m in XREF_RE.finditer(line):
+                major = sys.intern(m.group("major")) if m.group("minor") else None
+                scan.xrefs.append((line_no, sys.intern(m.group("ref")), major))
+
+        if line_no in fence_lines:
+            in_code_block = not in_code_block
+            continue
+
+        if not in_code_block and "inf_" in line and not line.lstrip().startswith(("#", ">")):
+            if has_inf_file_usage(line):
+                add_issue(
+                    scan.inf_issues,
+                    f"SSOT term: specs/{name}:{line_no} -- "
+                    f"inf_ file-role prefix used in example (§2.7.8: inf_ is forbidden)",
+                )
+
+        for rule_id, ssot_file, pattern, literal in ssot_rules:
+            if in_code_block and rule_id not in SSOT_CHECK_IN_CODE_BLOCKS:
+                continue
+            if literal in line and pattern.search(line):
+                scan.ssot_warnings.append(
+                    f"SSOT restatement: specs/{name}:{line_no} -- "
+                    f"rule '{rule_id}' restated outside SSOT "
+                    f"(canonical: specs/{ssot_file})"
+                )
+
+
+def collect_heading_sections(line: str, sections: set[str]) -> None:
+    """Add the section or appendix id a heading *line* defines to *sections*.
+
+    Numeric ids are interned, as are the xref keys looked up against them, so
+    a hit compares by identity instead of by content.
+    """
+    m = SECTION_HEADING_RE.match(line)
+    if m:
+        major = sys.intern(m.group("major"))
+        minor = m.group("minor")
+        if minor:
+            sections.add(sys.intern(f"{major}.{minor}"))
+        sections.add(major)
+        return
+    m = APPENDIX_HEADING_RE.match(line)
+    if m:
+        letter = m.group("letter")
+        app_minor = m.group("minor")
+        if app_minor:
+            sections.add(f"A{app_minor}")
+        sections.add(f"Appendix {letter}")
+
+
+def scan_spec_file(task: tuple[Path, bool, int | None]) -> SpecFileScan:
+    """Read one spec file once and run every per-file check on it.
+
+    *task* is ``(path, has_valid_name, file_number)``; structure checks only
+    apply to validly named files. Independent of other files, so it can run
+    in a worker process.
+    """
+    spec_file, has_valid_name, file_number = task
+    name = spec_file.name
+    text = get_file_text_utf8(spec_file)
+    lines = text.splitlines()
+    scan = SpecFileScan()
+    if has_valid_name:
+        check_spec_structure(name, text, lines, file_number, scan.structure_issues)
+    # A blank file ("Empty file" above) has no headings, references or rule
+    # text, so the line scan could only come back empty
+    if text and not text.isspace():
+        scan_spec_lines(name, text, lines, scan)
+    return scan
+
+
+def scan_spec_files(tasks: list[tuple[Path, bool, int | None]], jobs: int) -> list[SpecFileScan]:
+    """Run scan_spec_file over *tasks* in order, fanning out to *jobs* processes for large runs."""
+    if jobs > 1 and len(tasks) >= PARALLEL_SCAN_MIN_FILES:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            chunksize = max(1, len(tasks) // (4 * jobs))
+            return list(executor.map(scan_spec_file, tasks, chunksize=chunksize))
+    return [scan_spec_file(task) for task in tasks]
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Verify comsect1 spec consistency.")
     parser.add_argument("-RepoRoot", dest="repo_root", default=None)
+    parser.add_argument("-Jobs", dest="jobs", type=int, default=None,
+                        help="Worker processes for scanning spec files (default: CPU count; 1 disables)")
     args = parser.parse_args()
 
     script_path = Path(__file__).resolve()
     repo_root = resolve_repo_root(script_path, args.repo_root)
+    jobs = args.jobs if args.jobs is not None else (os.cpu_count() or 1)
 
     specs_dir = repo_root / "specs"
     readme_path = repo_root / "README.md"
@@ -68,7 +397,11 @@ def main() -> int:
     if not specs_dir.is_dir():
         raise RuntimeError(f"Missing folder: {specs_dir}")
 
-    spec_files = sorted(specs_dir.glob("*.md"), key=lambda p: p.name)
+    # Same entries as glob("*.md"), but from the names scandir already has
+    with os.scandir(specs_dir) as entries:
+        spec_names = [entry.name for entry in entries if entry.name.endswith(".md")]
+    spec_names.sort()
+    spec_files = [specs_dir / spec_name for spec_name in spec_names]
     if not spec_files:
         raise RuntimeError(f"No spec files found in: {specs_dir}")
 
@@ -80,251 +413,62 @@ def main() -> int:
             rel_path = file.relative_to(repo_root).as_posix()
             add_issue(issues, f"UTF-8 BOM is not allowed: {rel_path}")
 
-    # Numbered sections: NN_slug.md
-    # Appendices: A<index>_slug.md (e.g., A1_exception_handling.md)
-    name_regex = re.compile(r"^(?:(?P<num>\d{2})|A(?P<appendixNum>\d+))_(?P<slug>[a-z0-9_]+)\.md$")
-
+    tasks: list[tuple[Path, bool, int | None]] = []
     for spec_file in spec_files:
-        if not name_regex.match(spec_file.name):
+        match = SPEC_NAME_RE.match(spec_file.name)
+        if not match:
             add_issue(
                 issues,
                 f"Invalid spec filename (expected NN_slug.md or A#_slug.md): specs/{spec_file.name}",
             )
-
-    for spec_file in spec_files:
-        match = name_regex.match(spec_file.name)
-        if not match:
-            continue
-
-        is_numbered_file = match.group("num") is not None
-        file_number = int(match.group("num")) if is_numbered_file else None
-        text = get_file_text_utf8(spec_file)
-
-        if "\ufffd" in text:
-            add_issue(issues, f"Encoding replacement character (U+FFFD) found: specs/{spec_file.name}")
-
-        lines = text.splitlines()
-        first_non_empty = next((line for line in lines if line.strip()), None)
-        if first_non_empty is None:
-            add_issue(issues, f"Empty file: specs/{spec_file.name}")
+            tasks.append((spec_file, False, None))
             continue
+        num = match.group("num")
+        tasks.append((spec_file, True, int(num) if num is not None else None))
 
-        h1_is_numeric = False
-        h1_number = None
+    scans = scan_spec_files(tasks, jobs)
 
-        h1_numeric_match = re.match(r"^#\s*(?P<n>\d+)\.\s+", first_non_empty)
-        if h1_numeric_match:
-            h1_number = int(h1_numeric_match.group("n"))
-            h1_is_numeric = True
-            if is_numbered_file and file_number is not None and h1_number != file_number:
-                add_issue(
-                    issues,
-                    f"H1 section number mismatch: specs/{spec_file.name} (H1={h1_number}, filename={file_number:02d})",
-                )
-        elif re.match(r"^#\s*Appendix\s+[A-Z]\.", first_non_empty):
-            pass
-        else:
-            add_issue(
-                issues,
-                f"H1 does not start with a section number (expected '# N. ...' or 'Appendix X. ...'): specs/{spec_file.name}",
-            )
+    for scan in scans:
+        issues.extend(scan.structure_issues)
+    for scan in scans:
+        issues.extend(scan.inf_issues)
 
-        if h1_is_numeric and is_numbered_file and h1_number is not None:
-            numbered_heading_regex = re.compile(r"^(?P<hash>#{2,6})\s+(?P<n>\d+)\.(?P<rest>.*)$")
-            numbered_headings: list[tuple[int, str, int]] = []
-            for idx, line in enumerate(lines, start=1):
-                heading_match = numbered_heading_regex.match(line)
-                if heading_match:
-                    numbered_headings.append((idx, line, int(heading_match.group("n"))))
-
-            if numbered_headings:
-                distinct_ns = sorted({item[2] for item in numbered_headings})
-                is_prefixed = len(distinct_ns) == 1 and distinct_ns[0] == h1_number
-                is_local = 1 in distinct_ns
-                if not is_prefixed and not is_local:
-                    first = numbered_headings[0]
-                    add_issue(
-                        issues,
-                        "Numbered headings do not match H1 N and do not start at 1: "
-                        f"specs/{spec_file.name}:{first[0]} ('{first[1].strip()}')",
-                    )
-
-    # SSOT term consistency: detect use of inf_ as an actual file-role prefix
-    # in code examples or file references (not in rules that forbid it).
-    # Matches inf_<word>.<ext> used as a filename, excluding inline code backticks
-    # where the spec is explaining "do not use inf_".
-    inf_file_usage_re = re.compile(r"(?<!`)inf_\w+\.(?:c|h|py|cs|vb)\b")
+    # Cross-reference validation: verify §X.Y and Section X.Y references
+    # against the heading registry built from all spec files
+    known_sections = frozenset().union(*(scan.sections for scan in scans))
 
-    for spec_file in spec_files:
-        text = get_file_text_utf8(spec_file)
-        in_code_block = False
-        for line_no, line in enumerate(text.splitlines(), start=1):
-            stripped = line.strip()
-            if stripped.startswith("```"):
-                in_code_block = not in_code_block
-                continue
-            if in_code_block:
-                continue
-            if stripped.startswith("#") or stripped.startswith(">"):
-                continue
-            if inf_file_usage_re.search(line):
+    for (spec_file, _, _), scan in zip(tasks, scans):
+        for line_no, ref, major in scan.xrefs:
+            # Broken only if neither the full ref nor its major section exists
+            if ref not in known_sections and (major is None or major not in known_sections):
                 add_issue(
                     issues,
-                    f"SSOT term: specs/{spec_file.name}:{line_no} -- "
-                    f"inf_ file-role prefix used in example (§2.7.8: inf_ is forbidden)",
+                    f"Broken cross-reference '§{ref}': specs/{spec_file.name}:{line_no}",
                 )
 
-    # Cross-reference validation: verify §X.Y and Section X.Y references
-    # Build heading registry from all spec files
-    section_heading_re = re.compile(
-        r"^#{1,6}\s+(?:(?P<major>\d+)\.(?P<minor>\d+(?:\.\d+)*)?)\s",
-    )
-    # Also match "Appendix X." headings
-    appendix_heading_re = re.compile(
-        r"^#{1,6}\s+Appendix\s+(?P<letter>[A-Z])(?P<minor>\d+)?\.?\s",
-    )
-    known_sections: set[str] = set()
-
-    for spec_file in spec_files:
-        text = get_file_text_utf8(spec_file)
-        for line in text.splitlines():
-            m = section_heading_re.match(line)
-            if m:
-                major = m.group("major")
-                minor = m.group("minor")
-                if minor:
-                    known_sections.add(f"{major}.{minor}")
-                known_sections.add(major)
-                continue
-            m = appendix_heading_re.match(line)
-            if m:
-                letter = m.group("letter")
-                app_minor = m.group("minor")
-                if app_minor:
-                    known_sections.add(f"A{app_minor}")
-                known_sections.add(f"Appendix {letter}")
-
-    # Scan for cross-references: §X.Y, Section X.Y, §X
-    xref_re = re.compile(r"(?:§|Section\s+)(\d+(?:\.\d+)*)")
-    for spec_file in spec_files:
-        text = get_file_text_utf8(spec_file)
-        for line_no, line in enumerate(text.splitlines(), start=1):
-            # Skip lines that define headings (they are definitions, not references)
-            if line.lstrip().startswith("#"):
-                continue
-            for m in xref_re.finditer(line):
-                ref = m.group(1)
-                # Check if the major section exists
-                major_part = ref.split(".")[0]
-                if major_part not in known_sections and ref not in known_sections:
-                    add_issue(
-                        issues,
-                        f"Broken cross-reference '§{ref}': specs/{spec_file.name}:{line_no}",
-                    )
-
-    # -----------------------------------------------------------------------
-    # SSOT restatement detection: warn when a normative rule is fully
-    # restated outside its designated Single Source of Truth file.
-    # -----------------------------------------------------------------------
-
-    # Each entry: rule-id -> (ssot filename, compiled regex pattern)
-    # The pattern matches FULL restatements, not brief "see §X" references.
-    _ssot_rules: list[tuple[str, str, re.Pattern[str]]] = [
-        (
-            "dep-direction",
-            "05_dependency_rules.md",
-            re.compile(
-                r"IDA\s*->\s*\{\s*own\s+PRX\s*,\s*own\s+POI\s*\}",
-            ),
-        ),
-        (
-            "ida-self-contain",
-            "04_layer_roles.md",
-            re.compile(
-                r"[Ii]dea\s+(?:must\s+not|does\s+not|cannot)\s+(?:include|access|depend\s+on|import)"
-                r".*(?:mdw_|svc_|hal_|bsp_)",
-            ),
-        ),
-        (
-            "feature-isolation",
-            "05_dependency_rules.md",
-            re.compile(
-                r"[Ff]eature\s*(?:<->|↔|\sto\s)\s*[Ff]eature.*stm_\s*only",
-            ),
-        ),
-        (
-            "hal-bsp-direction",
-            "05_dependency_rules.md",
-            re.compile(
-                r"(?:^|\s)HAL\s*->\s*BSP(?:\s|$)",
-            ),
-        ),
-        (
-            "cross-feature-prohibition",
-            "05_dependency_rules.md",
-            re.compile(
-                r"(?:prx_|poi_).*must\s+not\s+include\s+(?:another|other)\s+feature",
-                re.IGNORECASE,
-            ),
-        ),
-    ]
-
-    # Files that are exempt from restatement warnings:
-    # - 09_code_examples.md: illustrative, non-normative
-    # - 12_version_history.md: historical record (low priority, warn anyway
-    #   for full restatements but we can suppress later if needed)
-    _ssot_exempt_files: set[str] = {"09_code_examples.md"}
-
-    # Rules whose signatures commonly appear inside code-block diagrams
-    # and should still be checked there.
-    _ssot_check_in_code_blocks: set[str] = {
-        "dep-direction",
-        "hal-bsp-direction",
-        "feature-isolation",
-    }
-
-    ssot_warnings: list[str] = []
-    for spec_file in spec_files:
-        if spec_file.name in _ssot_exempt_files:
-            continue
-        text = get_file_text_utf8(spec_file)
-        in_code_block = False
-        for line_no, line in enumerate(text.splitlines(), start=1):
-            stripped = line.strip()
-            if stripped.startswith("```"):
-                in_code_block = not in_code_block
-                continue
-            for rule_id, ssot_file, pattern in _ssot_rules:
-                if in_code_block and rule_id not in _ssot_check_in_code_blocks:
-                    continue
-                if spec_file.name == ssot_file:
-                    continue  # this IS the SSOT file
-                if pattern.search(line):
-                    ssot_warnings.append(
-                        f"SSOT restatement: specs/{spec_file.name}:{line_no} -- "
-                        f"rule '{rule_id}' restated outside SSOT "
-                        f"(canonical: specs/{ssot_file})"
-                    )
-
+    ssot_warnings = [warning for scan in scans for warning in scan.ssot_warnings]
     if ssot_warnings:
-        print(f"\nSSOT restatement warnings: {len(ssot_warnings)}")
-        for w in ssot_warnings:
-            print(f"  (advisory) {w}")
+        sys.stdout.write(
+            f"\nSSOT restatement warnings: {len(ssot_warnings)}\n"
+            + "".join(f"  (advisory) {w}\n" for w in ssot_warnings)
+        )
 
     # Lightweight README hygiene checks
     if readme_path.is_file():
-        readme = get_file_text_utf8(readme_path)
-        if "\ufffd" in readme:
+        has_replacement, has_double_q = quick_artifact_scan(readme_path)
+        if has_replacement:
             add_issue(issues, "Encoding replacement character (U+FFFD) found: README.md")
-        if re.search(r"\?{2,}", readme):
+        if has_double_q:
             add_issue(issues, "Suspicious '??' sequences found: README.md (likely encoding artifacts)")
     else:
         add_issue(issues, "README.md not found")
 
-    print("Spec verification complete.")
-    print(f"Issues: {len(issues)}")
-    for message in issues:
-        print(f"- {message}")
+    # One write for the whole issue list instead of a print() per issue
+    sys.stdout.write(
+        "Spec verification complete.\n"
+        f"Issues: {len(issues)}\n"
+        + "".join(f"- {message}\n" for message in issues)
+    )
 
     if issues:
         print(f"\nGate FAILED -- {len(issues)} issue(s) must be resolved.")
@@ -8,9 +8,13 @@ See: specs/11_checklist.md (Red Flags), v1.0.1 Layer Balance Invariant.
 
 from __future__ import annotations
 
+import fnmatch
+import os
 import re
+import sys
+from functools import lru_cache
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterable, Iterator, Union
 
 # ---------------------------------------------------------------------------
 # Shared constants
@@ -21,6 +25,11 @@ MIN_PRX_LINES_FOR_FAT_CHECK = 5
 MIN_POI_WRAPPER_COUNT = 2
 SVC_INFRA_ORPHAN_MAX_LINES = 30
 
+# Build files Verify-Comsect1Code scans for platform evidence, and the
+# directories that walk never enters. The AIAD gate fingerprints the same set.
+BUILD_FILE_PATTERNS = ("CMakeLists.txt", "*.cmake", "Makefile", "makefile", "*.mk")
+BUILD_SKIP_DIRS = {".git", ".hg", ".svn", ".cmakebuild", "build", "out", "dist", "node_modules", ".venv", "venv", "__pycache__"}
+
 DOMAIN_CONDITIONAL_RE = re.compile(
     r"\b(?:if|switch|case)\b.*\b(?:"
     r"mode|state|status|level|type|flag|enable|disable|active|threshold"
@@ -49,6 +58,7 @@ _SVC_WRAPPER_BODY_RE = re.compile(r"\bSvc_\w+\s*\([^(){};]*\)\s*\{([^{}]*)\}", r
 _SVC_SINGLE_CALL_RE = re.compile(r"^\s*(?:return\s+)?(?P<callee>[A-Za-z_][A-Za-z0-9_]*)\s*\([^;]*\)\s*;\s*$", re.DOTALL)
 _SVC_NON_OWNER_CALL_RE = re.compile(r"^(?:Lin[A-Z]\w*|Prx_\w+|Poi_\w+|Ida_\w+|ld_\w+|l_ifc_\w+)$")
 _SVC_BACKEND_CALL_RE = re.compile(r"^Svc(?:_|[A-Z])[A-Za-z0-9_]*_Backend[A-Za-z0-9_]*$")
+_SVC_FUNC_NAME_RE = re.compile(r"\b(Svc_\w+)\s*\(")
 _SVC_REGISTRY_NAME_RE = re.compile(r"\b(?:Register|RunTask|GetTask|GetUserPort|GetOps|SetOps)\b")
 _SVC_INFRA_INCLUDE_RE = re.compile(r"#include\s+[<\"](?:mdw_|hal_)\w+")
 _PUBLIC_API_CALL_RE = re.compile(r"\b(?P<name>(?:l_ifc|ld)_[A-Za-z0-9_]+)\s*\(")
@@ -61,38 +71,182 @@ _PUBLIC_API_DEF_RE = re.compile(
 # Utilities
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=32)
 def resolve_repo_root(script_path: Path, repo_root_arg: str | None) -> Path:
-    """Resolve the repository root from script location or explicit argument."""
+    """Resolve the repository root from script location or explicit argument.
+
+    *script_path* is the caller's already-resolved ``Path(__file__).resolve()``,
+    so its grandparent is canonical without another symlink walk. An explicit
+    argument still goes through realpath so symlinked roots compare equal.
+    """
     if repo_root_arg:
-        return Path(repo_root_arg).resolve()
-    return (script_path.parent / "..").resolve()
+        return Path(os.path.realpath(repo_root_arg))
+    return script_path.parent.parent
+
+
+def iter_build_files(repo_root: Path) -> Iterator[Path]:
+    """Yield build files under *repo_root* in a single os.scandir walk.
+
+    Skip directories are pruned instead of walked and filtered afterwards.
+    Files are grouped by BUILD_FILE_PATTERNS order and, within a pattern,
+    follow the same pre-order sequence Path.rglob would produce.
+    """
+    if any(part.lower() in BUILD_SKIP_DIRS for part in repo_root.parts):
+        return
+
+    matches: list[list[Path]] = [[] for _ in BUILD_FILE_PATTERNS]
+
+    def walk(directory: str) -> None:
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            return
+        subdirs = []
+        for entry in entries:
+            name = entry.name
+            for index, pattern in enumerate(BUILD_FILE_PATTERNS):
+                if fnmatch.fnmatch(name, pattern):
+                    matches[index].append(Path(entry.path))
+            try:
+                if entry.is_dir() and not entry.is_symlink() and name.lower() not in BUILD_SKIP_DIRS:
+                    subdirs.append(entry.path)
+            except OSError:
+                continue
+        for subdir in subdirs:
+            walk(subdir)
+
+    walk(os.fspath(repo_root))
+    for paths in matches:
+        yield from paths
+
+
+class FindingTable:
+    """Column-oriented finding store: one list per field, appended in lockstep.
+
+    Holds findings without a dict per entry; :meth:`records` builds the usual
+    lowercase-key dicts only when printing or writing a report.
+    """
+
+    __slots__ = ("severity", "file", "line", "rule", "message", "_seen")
+
+    def __init__(self, *, unique: bool = False) -> None:
+        """*unique* drops any finding whose (file, line, rule) was already added."""
+        self.severity: list[str] = []
+        self.file: list[str] = []
+        self.line: list[int] = []
+        self.rule: list[str] = []
+        self.message: list[str] = []
+        self._seen: set[tuple[str, int, str]] | None = set() if unique else None
+
+    def __len__(self) -> int:
+        return len(self.severity)
+
+    def add(self, severity: str, file_path: str | Path, line: int, rule: str, message: str) -> None:
+        file_str = str(file_path)
+        rule = sys.intern(rule)
+        if self._seen is not None:
+            key = (file_str, line, rule)
+            if key in self._seen:
+                return
+            self._seen.add(key)
+        self.severity.append(sys.intern(severity))
+        self.file.append(file_str)
+        self.line.append(line)
+        self.rule.append(rule)
+        self.message.append(message)
+
+    def count(self, severity: str) -> int:
+        return self.severity.count(severity)
+
+    def records(self, severity: str | None = None, *, sort: bool = False) -> list[dict[str, object]]:
+        """Materialize findings (optionally only one *severity*) as dicts.
+
+        Insertion order by default; *sort* orders by (file, line, rule).
+        """
+        indices = [
+            index for index, value in enumerate(self.severity)
+            if severity is None or value == severity
+        ]
+        if sort:
+            indices.sort(key=lambda index: (self.file[index], self.line[index], self.rule[index]))
+        return [
+            {
+                "severity": self.severity[index],
+                "file": self.file[index],
+                "line": self.line[index],
+                "rule": self.rule[index],
+                "message": self.message[index],
+            }
+            for index in indices
+        ]
+
+
+# Where findings are collected: a plain list of dicts or a FindingTable.
+# Union rather than '|': the alias is evaluated at runtime, also on Python 3.9.
+FindingSink = Union[list[dict[str, object]], FindingTable]
 
 
 def add_finding(
-    findings: list[dict[str, object]],
+    findings: FindingSink,
     severity: str,
     file_path: str | Path,
     line: int,
     rule: str,
     message: str,
 ) -> None:
-    """Append a normalized finding dict (lowercase keys)."""
+    """Append a normalized finding (lowercase keys) to *findings*.
+
+    Severity and rule ids come from a small vocabulary that repeats across
+    thousands of findings, so they are interned.
+    """
+    if isinstance(findings, FindingTable):
+        findings.add(severity, file_path, line, rule, message)
+        return
     findings.append({
-        "severity": severity,
+        "severity": sys.intern(severity),
         "file": str(file_path),
         "line": line,
-        "rule": rule,
+        "rule": sys.intern(rule),
         "message": message,
     })
 
 
-def collect_source_files(root: Path, extensions: set[str]) -> list[Path]:
-    """Recursively collect files matching given extensions."""
+def collect_source_files(
+    root: Path,
+    extensions: set[str],
+    sizes: dict[Path, int] | None = None,
+) -> list[Path]:
+    """Recursively collect files matching given extensions.
+
+    Walks with os.scandir so file/dir checks reuse the cached DirEntry type.
+    Like Path.rglob, symlinked directories are not descended into and
+    unreadable directories are skipped. When *sizes* is given it is filled
+    with each collected file's size from DirEntry.stat(), which costs no
+    extra system call on Windows.
+    """
     files = []
-    for p in root.rglob("*"):
-        if p.is_file() and p.suffix.lower() in extensions:
-            files.append(p)
-    return sorted(set(files))
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    name = entry.name
+                    dot = name.rfind(".")
+                    if dot > 0 and name[dot:].lower() in extensions and entry.is_file():
+                        path = Path(entry.path)
+                        files.append(path)
+                        if sizes is not None:
+                            try:
+                                sizes[path] = entry.stat().st_size
+                            except OSError:
+                                pass
+        except OSError:
+            continue
+    return sorted(files)
 
 
 def has_comsect1_boundary(root: Path) -> bool:
@@ -120,7 +274,7 @@ def validate_comsect1_root_boundary(root: Path) -> str | None:
 
 def verify_folder_structure(
     root: Path,
-    findings: list[dict[str, object]],
+    findings: FindingSink,
 ) -> None:
     """Check that the canonical comsect1 folder skeleton is present (Section 7.3, 7.5, 7.10).
 
@@ -183,37 +337,135 @@ def count_code_lines(
         skip_preprocessor: If True, skip lines starting with ``#``
             (C preprocessor directives).
     """
-    count = 0
-    in_block_comment = False
     try:
         with path.open("r", encoding="utf-8", errors="replace") as fh:
-            for line in fh:
-                stripped = line.strip()
-                if in_block_comment:
-                    if "*/" in stripped:
-                        in_block_comment = False
-                    continue
-                if stripped.startswith("/*"):
-                    if "*/" not in stripped[2:]:
-                        in_block_comment = True
-                    continue  # single-line /* … */ also skipped
-                if not stripped:
-                    continue
-                if any(stripped.startswith(p) for p in line_comment_prefixes):
-                    continue
-                if skip_preprocessor and stripped.startswith("#"):
-                    continue
-                count += 1
+            return count_code_lines_from_lines(
+                fh,
+                line_comment_prefixes=line_comment_prefixes,
+                skip_preprocessor=skip_preprocessor,
+            )
     except OSError:
-        pass
+        return 0
+
+
+def count_code_lines_from_lines(
+    lines: Iterable[str],
+    *,
+    line_comment_prefixes: tuple[str, ...] = ("//",),
+    skip_preprocessor: bool = False,
+) -> int:
+    """Count non-blank, non-comment lines in already-read source lines.
+
+    Same rules as :func:`count_code_lines`; use this when the text is in hand.
+    """
+    count = 0
+    in_block_comment = False
+    for line in lines:
+        stripped = line.strip()
+        if in_block_comment:
+            if "*/" in stripped:
+                in_block_comment = False
+            continue
+        if stripped.startswith("/*"):
+            if "*/" not in stripped[2:]:
+                in_block_comment = True
+            continue  # single-line /* … */ also skipped
+        if not stripped:
+            continue
+        if any(stripped.startswith(p) for p in line_comment_prefixes):
+            continue
+        if skip_preprocessor and stripped.startswith("#"):
+            continue
+        count += 1
     return count
 
 
+def count_code_lines_from_text(
+    text: str,
+    *,
+    line_comment_prefixes: tuple[str, ...] = ("//",),
+    skip_preprocessor: bool = False,
+) -> int:
+    """Count code lines in ``\\n``-separated *text*; same rules as :func:`count_code_lines`.
+
+    When *text* contains no comment or (skipped) preprocessor marker at all,
+    only blank lines can be excluded, so the per-line state machine is skipped.
+    """
+    lines = text.split("\n")
+    markers = ("/*", *line_comment_prefixes, *(("#",) if skip_preprocessor else ()))
+    if not any(marker in text for marker in markers):
+        return sum(1 for line in lines if line and not line.isspace())
+    return count_code_lines_from_lines(
+        lines,
+        line_comment_prefixes=line_comment_prefixes,
+        skip_preprocessor=skip_preprocessor,
+    )
+
+
+def count_domain_conditionals(text: str) -> int:
+    """Count domain-semantic conditional lines in *text*.
+
+    Lines with mechanical context (HAL/BSP/peripheral state checks) or the
+    GATE_MECHANICAL_CONDITIONAL suppression comment are not counted.
+    """
+    # One search short-circuits the common no-hit file before splitting lines.
+    if not DOMAIN_CONDITIONAL_RE.search(text):
+        return 0
+    effective = 0
+    for line in text.splitlines():
+        if GATE_MECHANICAL_SUPPRESSION in line:
+            continue
+        if DOMAIN_CONDITIONAL_RE.search(line):
+            if not MECHANICAL_CONTEXT_RE.search(line):
+                effective += 1
+    return effective
+
+
+def read_source_text(path: Path) -> str:
+    """Read a source file as UTF-8, replacing undecodable bytes."""
+    return path.read_text(encoding="utf-8", errors="replace")
+
+
+def count_file_domain_conditionals(path: Path) -> int:
+    """Read *path* and count its domain-semantic conditional lines (raises OSError)."""
+    return count_domain_conditionals(read_source_text(path))
+
+
 def line_number_from_offset(text: str, offset: int) -> int:
     """Return the 1-based line number for *offset* within *text*."""
     return text.count("\n", 0, offset) + 1
 
 
+# Line boundaries str.splitlines() honours besides '\n' (read_text already
+# folds '\r\n' and '\r'). Whole-text scans that must report the same line
+# numbers as a splitlines() loop fall back to per-line when any is present.
+OTHER_LINE_BREAK_RE = re.compile(r"[\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")
+
+
+def iter_line_matches(pattern: re.Pattern[str], text: str) -> Iterator[tuple[int, re.Match[str]]]:
+    """Yield ``(line_no, match)`` for every match of *pattern* in *text*.
+
+    Newlines are counted incrementally between successive matches, so the
+    whole scan stays linear in the text length.
+    """
+    line_no = 1
+    position = 0
+    for match in pattern.finditer(text):
+        start = match.start()
+        line_no += text.count("\n", position, start)
+        position = start
+        yield line_no, match
+
+
+def iter_match_line_numbers(pattern: re.Pattern[str], text: str) -> Iterator[int]:
+    """Yield the 1-based line number of every line where *pattern* matches in *text*, once each."""
+    last_line = 0
+    for line_no, _ in iter_line_matches(pattern, text):
+        if line_no != last_line:
+            last_line = line_no
+            yield line_no
+
+
 # ---------------------------------------------------------------------------
 # Layer Balance Invariant (v1.0.1, error severity)
 # ---------------------------------------------------------------------------
@@ -221,16 +473,20 @@ def line_number_from_offset(text: str, offset: int) -> int:
 def verify_layer_balance(
     ida_files: list[Path],
     poi_files: list[Path],
-    findings: list[dict[str, object]],
+    findings: FindingSink,
     *,
     extract_feature: Callable[[Path], str | None],
     count_lines: Callable[[Path], int],
+    count_conditionals: Callable[[Path], int] = count_file_domain_conditionals,
 ) -> None:
     """Check that ida_ contains domain decisions, not just pass-through.
 
     ida_ MUST contain domain decisions.  Empty forwarding-only ida_ paired
     with domain-semantic conditionals in poi_ is a structural violation equal
     in severity to dependency direction errors.
+
+    *count_conditionals* lets a caller that already scanned the poi_ sources
+    supply the counts instead of re-reading the files.
     """
     features: dict[str, dict[str, list[Path]]] = {}
     for f in ida_files:
@@ -260,24 +516,13 @@ def verify_layer_balance(
         fat_poi_hits = 0
         for pf in roles["poiesis"]:
             try:
-                text = pf.read_text(encoding="utf-8", errors="replace")
-                hits = DOMAIN_CONDITIONAL_RE.findall(text)
-                if hits:
-                    # Exclude mechanical context hits (HAL/BSP state
-                    # checks) and suppressed lines from the count.
-                    effective = 0
-                    for line in text.splitlines():
-                        if GATE_MECHANICAL_SUPPRESSION in line:
-                            continue
-                        if DOMAIN_CONDITIONAL_RE.search(line):
-                            if not MECHANICAL_CONTEXT_RE.search(line):
-                                effective += 1
-                    if effective > 0:
-                        fat_poi_file = pf
-                        fat_poi_hits = effective
-                        break
+                effective = count_conditionals(pf)
             except OSError:
                 continue
+            if effective > 0:
+                fat_poi_file = pf
+                fat_poi_hits = effective
+                break
 
         if fat_poi_file is not None:
             for ida_file in roles["idea"]:
@@ -296,20 +541,62 @@ def verify_layer_balance(
 # Red Flag heuristics (§11.8, advisory severity)
 # ---------------------------------------------------------------------------
 
+def count_poi_wrappers(text: str) -> int:
+    """Count Poi_ functions whose body is a single pass-through call to a Prx_ function."""
+    return sum(
+        1 for m in _POI_WRAPPER_BODY_RE.finditer(text)
+        if _PRX_SINGLE_CALL_RE.match(m.group(1))
+    )
+
+
+def praxis_red_flag_facts(text: str) -> tuple[bool, bool]:
+    """Return (has PRX_EXISTENCE_CONDITION marker, has a domain conditional) for prx_ source."""
+    return "PRX_EXISTENCE_CONDITION" in text, DOMAIN_CONDITIONAL_RE.search(text) is not None
+
+
 def verify_red_flags_common(
     ida_files: list[Path],
     prx_files: list[Path],
     poi_files: list[Path],
-    findings: list[dict[str, object]],
+    findings: FindingSink,
     *,
     count_lines: Callable[[Path], int],
     extract_feature: Callable[[Path], str | None] | None = None,
+    count_conditionals: Callable[[Path], int] | None = None,
+    read_text: Callable[[Path], str] | None = None,
+    poi_wrapper_count: Callable[[Path], int] | None = None,
+    praxis_facts: Callable[[Path], tuple[bool, bool]] | None = None,
 ) -> None:
     """Universal Red Flag checks: Empty Idea, Fat Poiesis, Fat Praxis, Praxis Scope Overflow.
 
     Language-specific red flags (e.g. OOP mutable-field check) are NOT
     included here -- each gate script adds its own extras after calling this.
+    *read_text* lets a caller that already holds the decoded sources serve
+    them instead of re-reading the files. A caller that keeps per-file facts
+    instead can pass *count_conditionals*, *poi_wrapper_count* (see
+    count_poi_wrappers) and *praxis_facts* (see praxis_red_flag_facts); the
+    files are then not read at all. Every callable must raise OSError like a read.
     """
+    if read_text is None:
+        read_text = read_source_text
+    # Text-derived defaults; a poi_ file feeds two checks, so read it once.
+    poi_texts: dict[Path, str] = {}
+
+    def read_poi(f: Path) -> str:
+        if f not in poi_texts:
+            poi_texts[f] = read_text(f)
+        return poi_texts[f]
+
+    if count_conditionals is None:
+        def count_conditionals(f: Path) -> int:
+            return count_domain_conditionals(read_poi(f))
+    if poi_wrapper_count is None:
+        def poi_wrapper_count(f: Path) -> int:
+            return count_poi_wrappers(read_poi(f))
+    if praxis_facts is None:
+        def praxis_facts(f: Path) -> tuple[bool, bool]:
+            return praxis_red_flag_facts(read_text(f))
+
     # Red Flag: Empty Idea
     for f in ida_files:
         code_lines = count_lines(f)
@@ -323,40 +610,30 @@ def verify_red_flags_common(
 
     # Red Flag: Fat Poiesis
     for f in poi_files:
+        # Mechanical context hits (HAL/BSP/peripheral state checks) and
+        # suppressed lines are not counted, to reduce false positives in
+        # hardware-facing poi_ files.
         try:
-            text = f.read_text(encoding="utf-8", errors="replace")
-            hits = DOMAIN_CONDITIONAL_RE.findall(text)
-            if hits:
-                # Subtract mechanical context hits (HAL/BSP/peripheral
-                # state checks) and lines with suppression comments to
-                # reduce false positives in hardware-facing poi_ files.
-                effective = 0
-                for line in text.splitlines():
-                    if GATE_MECHANICAL_SUPPRESSION in line:
-                        continue
-                    if DOMAIN_CONDITIONAL_RE.search(line):
-                        if not MECHANICAL_CONTEXT_RE.search(line):
-                            effective += 1
-                if effective > 0:
-                    add_finding(
-                        findings, "warning", f, 0, "red-flag-fat-poiesis",
-                        f"Possible Fat Poiesis: poi_ contains {effective} "
-                        "domain-meaningful conditional(s). "
-                        "Consider moving business logic to ida_ or prx_.",
-                    )
+            effective = count_conditionals(f)
         except OSError:
-            pass
+            continue
+        if effective > 0:
+            add_finding(
+                findings, "warning", f, 0, "red-flag-fat-poiesis",
+                f"Possible Fat Poiesis: poi_ contains {effective} "
+                "domain-meaningful conditional(s). "
+                "Consider moving business logic to ida_ or prx_.",
+            )
 
     # Red Flag: Fat Praxis
     for f in prx_files:
         code_lines = count_lines(f)
         if code_lines >= MIN_PRX_LINES_FOR_FAT_CHECK:
             try:
-                text = f.read_text(encoding="utf-8", errors="replace")
-                if "PRX_EXISTENCE_CONDITION" in text:
+                has_existence_condition, has_domain_conditional = praxis_facts(f)
+                if has_existence_condition:
                     continue  # documented type-coupling justification suppresses advisory
-                hits = DOMAIN_CONDITIONAL_RE.findall(text)
-                if not hits:
+                if not has_domain_conditional:
                     add_finding(
                         findings, "warning", f, 0, "red-flag-fat-praxis",
                         f"prx_ source has {code_lines} code lines but no "
@@ -373,21 +650,17 @@ def verify_red_flags_common(
     # function pointer directly rather than routing through a poi_ intermediary.
     for f in poi_files:
         try:
-            text = f.read_text(encoding="utf-8", errors="replace")
-            wrapper_count = sum(
-                1 for m in _POI_WRAPPER_BODY_RE.finditer(text)
-                if _PRX_SINGLE_CALL_RE.match(m.group(1))
-            )
-            if wrapper_count >= MIN_POI_WRAPPER_COUNT:
-                add_finding(
-                    findings, "warning", f, 0, "red-flag-poi-wrapper",
-                    f"poi_ contains {wrapper_count} function(s) that are pure "
-                    "pass-throughs to prx_. "
-                    "Register prx_ function pointers directly in the ops table "
-                    "instead of wrapping them in poi_.",
-                )
+            wrapper_count = poi_wrapper_count(f)
         except OSError:
-            pass
+            continue
+        if wrapper_count >= MIN_POI_WRAPPER_COUNT:
+            add_finding(
+                findings, "warning", f, 0, "red-flag-poi-wrapper",
+                f"poi_ contains {wrapper_count} function(s) that are pure "
+                "pass-throughs to prx_. "
+                "Register prx_ function pointers directly in the ops table "
+                "instead of wrapping them in poi_.",
+            )
 
     # Red Flag: Praxis Scope Overflow (§10.6)
     # When prx_ code lines exceed ida_ code lines for the same feature,
@@ -427,7 +700,7 @@ def verify_red_flags_common(
 def verify_service_ownership_common(
     service_files: list[Path],
     internal_impl_files: list[Path],
-    findings: list[dict[str, object]],
+    findings: FindingSink,
     *,
     count_lines: Callable[[Path], int] | None = None,
 ) -> None:
@@ -444,7 +717,7 @@ def verify_service_ownership_common(
 
         for match in _SVC_WRAPPER_BODY_RE.finditer(text):
             public_count += 1
-            name_match = re.search(r"\b(Svc_\w+)\s*\(", match.group(0))
+            name_match = _SVC_FUNC_NAME_RE.search(match.group(0))
             func_name = name_match.group(1) if name_match else "Svc_<unknown>"
             line_no = line_number_from_offset(text, match.start())
             if _SVC_REGISTRY_NAME_RE.search(func_name):
@@ -496,7 +769,7 @@ def verify_service_ownership_common(
         if (
             public_count >= 2
             and registry_like_count >= max(2, (public_count + 1) // 2)
-            and not DOMAIN_CONDITIONAL_RE.findall(text)
+            and not DOMAIN_CONDITIONAL_RE.search(text)
         ):
             add_finding(
                 findings,